@@ -0,0 +1,162 @@
+# AST node classes built by PythonParser and read by PythonSemanticAnalyzer and PythonToCppConverter
+from collections.abc import Mapping
+
+# Base for AST nodes: fields live in __slots__ instead of a per-node dict, while node['field'],
+# node.get(...) and `in` keep working for the converter and JSON dumps. The node class is the tag
+# passes dispatch on; `type` stays the readable string the converter and JSON output use
+class Node(Mapping):
+    __slots__ = ()
+    type = None
+
+    def __getitem__(self, key):
+        if key == 'type':
+            return self.type
+        if key in self.__slots__:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                pass  # Optional field that was never set
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key == 'type' or (key in self.__slots__ and hasattr(self, key))
+
+    def __iter__(self):
+        yield 'type'
+        for field in self.__slots__:
+            if hasattr(self, field):
+                yield field
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    # Shallow dict of the node's fields; pass as json.dumps(default=Node.to_dict) to serialize a tree
+    def to_dict(self):
+        return {key: self[key] for key in self}
+
+class Program(Node):
+    __slots__ = ('statements',)
+    type = 'PROGRAM'
+    def __init__(self, statements):
+        self.statements = statements
+
+class FunctionDef(Node):
+    __slots__ = ('return_type', 'func_name', 'body')
+    type = 'FUNCTION_DEFINITION'
+    def __init__(self, return_type, func_name, body):
+        self.return_type = return_type
+        self.func_name = func_name
+        self.body = body
+
+class ForLoop(Node):
+    __slots__ = ('iterator', 'limit', 'start', 'stop', 'step', 'body')  # range() arguments left unset when absent
+    type = 'FOR_LOOP'
+    def __init__(self, iterator, body, limit=None, start=None, stop=None, step=None):
+        self.iterator = iterator
+        if limit is not None:
+            self.limit = limit
+        if start is not None:
+            self.start = start
+        if stop is not None:
+            self.stop = stop
+        if step is not None:
+            self.step = step
+        self.body = body
+
+class WhileLoop(Node):
+    __slots__ = ('condition', 'body')
+    type = 'WHILE_LOOP'
+    def __init__(self, condition, body):
+        self.condition = condition
+        self.body = body
+
+class VarDecl(Node):
+    __slots__ = ('var_type', 'var_name', 'initializer')  # initializer is left unset when absent
+    type = 'VARIABLE_DECLARATION'
+    def __init__(self, var_type, var_name, initializer=None):
+        self.var_type = var_type
+        self.var_name = var_name
+        if initializer is not None:
+            self.initializer = initializer
+
+class Assignment(Node):
+    __slots__ = ('var_name', 'expression')
+    type = 'ASSIGNMENT'
+    def __init__(self, var_name, expression):
+        self.var_name = var_name
+        self.expression = expression
+
+class IfStmt(Node):
+    __slots__ = ('condition', 'true_branch', 'false_branch')
+    type = 'IF_STATEMENT'
+    def __init__(self, condition, true_branch, false_branch):
+        self.condition = condition
+        self.true_branch = true_branch
+        self.false_branch = false_branch
+
+class IoStmt(Node):
+    __slots__ = ('io_operator', 'expression')
+    type = 'IO_STATEMENT'
+    def __init__(self, io_operator, expression):
+        self.io_operator = io_operator
+        self.expression = expression
+
+class ReturnStmt(Node):
+    __slots__ = ('expression',)
+    type = 'RETURN_STATEMENT'
+    def __init__(self, expression):
+        self.expression = expression
+
+class PrintStmt(Node):
+    __slots__ = ('args',)
+    type = 'PRINT_STATEMENT'
+    def __init__(self, args):
+        self.args = args
+
+class Block(Node):
+    __slots__ = ('statements',)
+    type = 'BLOCK'
+    def __init__(self, statements):
+        self.statements = statements
+
+class FuncCall(Node):
+    __slots__ = ('func_name', 'args')
+    type = 'FUNCTION_CALL'
+    def __init__(self, func_name, args):
+        self.func_name = func_name
+        self.args = args
+
+class BinaryExpr(Node):
+    __slots__ = ('operator', 'left', 'right')
+    type = 'BINARY_EXPRESSION'
+    def __init__(self, operator, left, right):
+        self.operator = operator
+        self.left = left
+        self.right = right
+
+class Number(Node):
+    __slots__ = ('value',)
+    type = 'NUMBER'
+    def __init__(self, value):
+        self.value = value
+
+class StringLit(Node):
+    __slots__ = ('value',)
+    type = 'STRING_LITERAL'
+    def __init__(self, value):
+        self.value = value
+
+class Identifier(Node):
+    __slots__ = ('value',)
+    type = 'IDENTIFIER'
+    def __init__(self, value):
+        self.value = value
\ No newline at end of file
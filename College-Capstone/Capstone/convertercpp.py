@@ -3,11 +3,18 @@ print(f"Running file: {os.path.realpath(__file__)}")
 
 from semantic_analyzer_cpp import SemanticAnalyzer
 
-# Converts an AST into Python code with optional main function wrapping
+INDENT = "    "  # One level of Python indentation
+LEAF_TYPES = frozenset(("STRING_LITERAL", "NUMBER", "IDENTIFIER"))  # Nodes emitted as their value
+UNROLL_LIMIT = 8  # Most iterations a constant for loop is unrolled into
+COMPOUND_OPERATORS = frozenset(("+", "-", "*", "/", "%"))  # x = x op y collapses to x op= y
+WRITE_TYPES = frozenset(("ASSIGNMENT", "VARIABLE_DECLARATION", "INCREMENT"))  # Nodes that set var_name
+
+# Converts an AST into Python code with optional main function wrapping and loop unrolling
 class Converter:
-    def __init__(self, data, use_main=False):
+    def __init__(self, data, use_main=False, unroll_loops=False):
         self.ast = data
         self.use_main = use_main
+        self.unroll_loops = unroll_loops
 
     # Generates Python code from the AST after semantic analysis
     def generate_code(self):
@@ -17,280 +24,346 @@ class Converter:
             print("Semantic Errors:", "\n".join(errors))
             return ""
         self.semantic_analyzer = semantic_analyzer
-        converted_code = self.generate_node(self.ast).strip()
+        self._parent_map = {}
+        self._cin_decls = {}
+        self._cout_cin_pairs = set()
+        self._cin_prompts = {}
+        self._substitutions = {}
+        self._prepass(self.ast, None)
         if self.use_main:
-            converted_code = f"def main():\n    {converted_code.replace('\n', '\n    ')}\n\nif __name__ == \"__main__\":\n    main()"
+            body = self.generate_node(self.ast, 1).rstrip()
+            converted_code = f"def main():\n{body}\n\nif __name__ == \"__main__\":\n    main()"
+        else:
+            converted_code = self.generate_node(self.ast).strip()
         print("Raw converted_code:", repr(converted_code))
         print("Generated Python Code:")
         print(converted_code)
         return converted_code
 
-    # Recursively generates code for a given AST node
-    def generate_node(self, node, statements=None, position=0, parent_statements=None):
-        if node["type"] == "PROGRAM":
-            stmts = [self.generate_node(stmt, node["statements"], i, node["statements"]) 
-                     for i, stmt in enumerate(node["statements"])]
-            return "\n".join(stmt.lstrip() for stmt in stmts if stmt)
-        elif node["type"] == "FUNCTION_DEFINITION":
-            body = [self.generate_node(stmt, node["body"], i, node["body"]) 
-                    for i, stmt in enumerate(node["body"])]
-            body_str = "\n".join(stmt for stmt in body if stmt.strip())
-            if node["func_name"] == "main" and not self.use_main:
-                return body_str
-            return f"def {node['func_name']}():\n    {body_str.replace('\n', '\n    ')}"
-        elif node["type"] == "IO_STATEMENT":
-            if not node.get("expressions"):
-                return "print()"
-            # Generate expressions and handle assignments in cout
-            expressions = []
-            assignments = []
-            for expr_node in node["expressions"]:
-                if (expr_node["type"] == "BINARY_EXPRESSION" and 
-                    expr_node["operator"] == "=" and 
-                    node["io_operator"] == "cout"):
-                    # Handle assignment inside cout
-                    var_name = self.generate_node(expr_node["left"])
-                    value = self.generate_node(expr_node["right"])
-                    assignments.append(f"{var_name} = {value}")
-                    expressions.append(var_name)  # Print the assigned variable
-                else:
-                    expressions.append(self.generate_node(expr_node))
+    # Recursively generates code for a given AST node, indenting statements by indent levels
+    def generate_node(self, node, indent=0):
+        node_type = node["type"]
+        if node_type in LEAF_TYPES:
+            # Literals and identifiers are emitted as written, without a handler call
+            if self._substitutions and node_type == "IDENTIFIER":
+                return self._substitutions.get(node["value"], node["value"])
+            return node["value"]
+        handler = self._HANDLERS.get(node_type)
+        if handler is None:
+            return ""
+        return handler(self, node, indent)
+
+    # Generates a list of statements, dropping those that produce no code
+    def _gen_statements(self, statements, indent):
+        lines = [self.generate_node(stmt, indent) for stmt in statements]
+        return "\n".join(line for line in lines if line)
+
+    # Generates the body of a loop or branch, which is either a block or a single statement
+    def _gen_body(self, body, indent):
+        if isinstance(body, dict) and body.get("type") == "BLOCK":
+            return self._gen_statements(body["statements"], indent)
+        return self.generate_node(body, indent)
+
+    # Joins the top-level statements of the program
+    def _gen_program(self, node, indent):
+        return self._gen_statements(node["statements"], indent)
+
+    # Emits a function, inlining main unless use_main is set
+    def _gen_function_definition(self, node, indent):
+        if node["func_name"] == "main" and not self.use_main:
+            return self._gen_statements(node["body"], indent)
+        body_str = self._gen_statements(node["body"], indent + 1)
+        return f"{INDENT * indent}def {node['func_name']}():\n{body_str}"
+
+    # Converts cout to print and cin to input
+    def _gen_io_statement(self, node, indent):
+        pad = INDENT * indent
+        if not node.get("expressions"):
+            return f"{pad}print()"
+        # Generate expressions and handle assignments in cout
+        expressions = []
+        assignments = []
+        for expr_node in node["expressions"]:
+            if (expr_node["type"] == "BINARY_EXPRESSION" and 
+                expr_node["operator"] == "=" and 
+                node["io_operator"] == "cout"):
+                # Handle assignment inside cout
+                var_name = self.generate_node(expr_node["left"])
+                value = self.generate_node(expr_node["right"])
+                assignments.append(f"{pad}{var_name} = {value}")
+                expressions.append(var_name)  # Print the assigned variable
+            else:
+                expressions.append(self.generate_node(expr_node))
+        
+        if node["io_operator"] == "cout":
+            is_prompt = id(node) in self._cout_cin_pairs
+            if is_prompt and len(expressions) == 1 and expressions[0].startswith('"'):
+                return "\n".join(assignments) if assignments else ""
             
-            if node["io_operator"] == "cout":
-                is_prompt = (
-                    statements and
-                    position + 1 < len(statements) and
-                    statements[position + 1]["type"] == "IO_STATEMENT" and
-                    statements[position + 1]["io_operator"] == "cin"
-                )
-                if is_prompt and len(expressions) == 1 and expressions[0].startswith('"'):
-                    return "\n".join(assignments) if assignments else ""
-                
-                f_string_parts = []
-                for expr in expressions:
-                    if expr.startswith('"') and expr.endswith('"'):
-                        cleaned_expr = expr.strip('"').replace('\\n', '')
-                        if cleaned_expr:
-                            f_string_parts.append(cleaned_expr)
-                    else:
-                        f_string_parts.append(f"{{{expr}}}")
-                output = f"print(f\"{''.join(f_string_parts)}\")"
-                has_newline = any(expr == '"\\n"' or (expr.startswith('"') and '\\n' in expr) for expr in expressions)
-                if not has_newline:
-                    output = f'print(f"{"".join(f_string_parts)}")'
-                
-                # Combine assignments and print statement
-                if assignments:
-                    return "\n".join(assignments + [output])
-                return output
-            elif node["io_operator"] == "cin":
-                var_name = expressions[0]
-                var_type = self.semantic_analyzer.lookup_variable(var_name)
-                if not var_type:
-                    var_type = self.lookup_variable_type(var_name, statements, position)
-                if statements and position > 0:
-                    prev_stmt = statements[position - 1]
-                    if prev_stmt["type"] == "IO_STATEMENT" and prev_stmt["io_operator"] == "cout":
-                        prompt = self.generate_node(prev_stmt["expressions"][0]).strip('"')
-                        if var_type == "int":
-                            return f"{var_name} = int(input(\"{prompt}\"))"
-                        return f"{var_name} = input(\"{prompt}\")"
+            # String literals are inlined without quotes or \n; everything else becomes a {placeholder}
+            f_string_parts = []
+            for expr_node, expr in zip(node["expressions"], expressions):
+                if expr_node["type"] == "STRING_LITERAL":
+                    cleaned_expr = expr_node["raw_no_quotes"]
+                    if expr_node["has_newline"]:
+                        cleaned_expr = cleaned_expr.replace('\\n', '')
+                    if cleaned_expr:
+                        f_string_parts.append(cleaned_expr)
+                else:
+                    f_string_parts.append(f"{{{expr}}}")
+            joined = "".join(f_string_parts)
+            output = f'{pad}print(f"{joined}")'
+
+            # Combine assignments and print statement
+            if assignments:
+                return "\n".join(assignments + [output])
+            return output
+        elif node["io_operator"] == "cin":
+            var_name = expressions[0]
+            # Globals known to the analyzer first, then a declaration earlier in the same statement list
+            var_type = self.semantic_analyzer.lookup_variable(var_name) or self._cin_decls.get(id(node))
+            prev_stmt = self._cin_prompts.get(id(node))
+            if prev_stmt is not None:
+                prompt = self.generate_node(prev_stmt["expressions"][0]).strip('"')
                 if var_type == "int":
-                    return f"{var_name} = int(input())"
-                return f"{var_name} = input()"
-        elif node["type"] == "VARIABLE_DECLARATION":
-            var_name = node["var_name"]
-            if "initializer" in node:
-                initializer = self.generate_node(node["initializer"])
-                return f"{var_name} = {initializer}"
+                    return f"{pad}{var_name} = int(input(\"{prompt}\"))"
+                return f"{pad}{var_name} = input(\"{prompt}\")"
+            if var_type == "int":
+                return f"{pad}{var_name} = int(input())"
+            return f"{pad}{var_name} = input()"
+        return ""
+
+    # Emits an initialized declaration as an assignment
+    def _gen_variable_declaration(self, node, indent):
+        var_name = node["var_name"]
+        if "initializer" in node:
+            initializer = self.generate_node(node["initializer"])
+            return f"{INDENT * indent}{var_name} = {initializer}"
+        return ""
+
+    # Emits an assignment, collapsing x = x op y into x op= y
+    def _gen_assignment(self, node, indent):
+        var_name = node["var_name"]
+        expression = node["expression"]
+        # Check if it's a compound assignment pattern (e.g., i = i + 2)
+        if (expression["type"] == "BINARY_EXPRESSION" and 
+            expression["operator"] in COMPOUND_OPERATORS and
+            expression["left"]["type"] == "IDENTIFIER" and
+            expression["left"]["value"] == var_name):
+            operator = expression["operator"]
+            right = self.generate_node(expression["right"])
+            return f"{INDENT * indent}{var_name} {operator}= {right}"
+        # Fallback to regular assignment
+        expr_code = self.generate_node(expression)
+        return f"{INDENT * indent}{var_name} = {expr_code}"
+
+    # Emits an expression used as a statement
+    def _gen_expression_statement(self, node, indent):
+        expression = self.generate_node(node["expression"])
+        return f"{INDENT * indent}{expression}" if expression else ""
+
+    # Converts a counting for loop into a range() loop
+    def _gen_for_loop(self, node, indent):
+        init = node["init"]
+        condition = node["condition"]
+        increment = node["increment"]
+        if init["type"] == "VARIABLE_DECLARATION" and "initializer" in init:
+            start = self.generate_node(init["initializer"])
+        elif init["type"] == "ASSIGNMENT":
+            start = self.generate_node(init["expression"])
+        else:
+            start = "0"
+        end = self.generate_node(condition["right"])
+        step = "1"
+        if condition["operator"] == "<=":
+            end = str(int(end) + 1)
+        elif condition["operator"] == "<":
+            pass
+        elif condition["operator"] == ">":
+            start, end = end, start
+            step = "-1"
+        elif condition["operator"] == ">=":
+            end = str(int(end) - 1)
+            step = "-1"
+        if increment:
+            if increment["type"] == "ASSIGNMENT":
+                incr_expr = increment["expression"]
+                if incr_expr["type"] == "BINARY_EXPRESSION":
+                    if incr_expr["operator"] == "+":
+                        step = self.generate_node(incr_expr["right"])
+                    elif incr_expr["operator"] == "-":
+                        step = f"-{self.generate_node(incr_expr['right'])}"
+            elif increment["type"] == "INCREMENT":
+                step = "1" if increment["operator"] == "++" else "-1"
+        var_name = init["var_name"]
+        if self.unroll_loops:
+            unrolled = self._unroll_for_loop(node, var_name, start, end, step, indent)
+            if unrolled:
+                return unrolled
+        range_str = f"range({start}, {end}, {step})"
+        body_str = self._gen_body(node["body"], indent + 1)
+        return f"{INDENT * indent}for {var_name} in {range_str}:\n{body_str}"
+
+    # Repeats the body once per value of a short constant range, or returns "" when the loop cannot be unrolled
+    def _unroll_for_loop(self, node, var_name, start, end, step, indent):
+        if node["init"]["type"] != "VARIABLE_DECLARATION":
+            return ""  # An outer variable must keep its final value after the loop
+        if not all(bound.lstrip("-").isdigit() for bound in (start, end, step)) or int(step) == 0:
             return ""
-        elif node["type"] == "ASSIGNMENT":
-            var_name = node["var_name"]
-            expression = node["expression"]
-            # Check if it's a compound assignment pattern (e.g., i = i + 2)
-            if (expression["type"] == "BINARY_EXPRESSION" and 
-                expression["operator"] in ["+", "-", "*", "/", "%"] and
-                expression["left"]["type"] == "IDENTIFIER" and
-                expression["left"]["value"] == var_name):
-                operator = expression["operator"]
-                right = self.generate_node(expression["right"])
-                return f"{var_name} {operator}= {right}"
-            # Fallback to regular assignment
-            expr_code = self.generate_node(expression)
-            return f"{var_name} = {expr_code}"
-        elif node["type"] == "EXPRESSION_STATEMENT":
-            expression = self.generate_node(node["expression"])
-            return expression if expression else ""
-        elif node["type"] == "FOR_LOOP":
-            init = node["init"]
-            condition = node["condition"]
-            increment = node["increment"]
-            body = node["body"]
-            if init["type"] == "VARIABLE_DECLARATION" and "initializer" in init:
-                start = self.generate_node(init["initializer"])
-            elif init["type"] == "ASSIGNMENT":
-                start = self.generate_node(init["expression"])
-            else:
-                start = "0"
-            end = self.generate_node(condition["right"])
-            step = "1"
-            if condition["operator"] == "<=":
-                end = str(int(end) + 1)
-            elif condition["operator"] == "<":
-                pass
-            elif condition["operator"] == ">":
-                start, end = end, start
-                step = "-1"
-            elif condition["operator"] == ">=":
-                end = str(int(end) - 1)
-                step = "-1"
-            if increment:
-                if increment["type"] == "ASSIGNMENT":
-                    incr_expr = increment["expression"]
-                    if incr_expr["type"] == "BINARY_EXPRESSION":
-                        if incr_expr["operator"] == "+":
-                            step = self.generate_node(incr_expr["right"])
-                        elif incr_expr["operator"] == "-":
-                            step = f"-{self.generate_node(incr_expr['right'])}"
-                elif increment["type"] == "INCREMENT":
-                    step = "1" if increment["operator"] == "++" else "-1"
-            var_name = init["var_name"]
-            range_str = f"range({start}, {end}, {step})"
-            if body["type"] == "BLOCK":
-                body_str = "\n".join(self.generate_node(stmt, body["statements"], i) 
-                                    for i, stmt in enumerate(body["statements"]))
-            else:
-                body_str = self.generate_node(body)
-            return f"for {var_name} in {range_str}:\n    {body_str.replace('\n', '\n    ')}"
-        elif node["type"] == "WHILE_LOOP":
-            condition_str = self.generate_node(node["condition"])
-            body_node = node["body"]
-            if isinstance(body_node, dict) and body_node.get("type") == "BLOCK":
-                body_lines = [self.generate_node(stmt, body_node["statements"], i, parent_statements) 
-                              for i, stmt in enumerate(body_node["statements"])]
-                body = "\n".join(line for line in body_lines if line)
-            else:
-                body = self.generate_node(body_node)
-            return f"while {condition_str}:\n    {body.replace('\n', '\n    ')}"
-        elif node["type"] == "INCREMENT":
-            var_name = node["var_name"]
-            if node["operator"] == "++":
-                return f"{var_name} += 1"
-            elif node["operator"] == "--":
-                return f"{var_name} -= 1"
-            else:
-                raise ValueError(f"Unsupported increment operator: {node['operator']}")
-        elif node["type"] == "BINARY_EXPRESSION":
-            left = self.generate_node(node["left"])
-            right = self.generate_node(node["right"])
-            operator = node["operator"]
-            return f"{left} {operator} {right}"
-        elif node["type"] == "STRING_LITERAL":
-            return node["value"]
-        elif node["type"] == "NUMBER":
-            return node["value"]
-        elif node["type"] == "IDENTIFIER":
-            return node["value"]
-        elif node["type"] == "RETURN_STATEMENT":
-            expression = self.generate_node(node["expression"])
-            parent = self.find_parent(node)
-            if parent and parent["type"] == "FUNCTION_DEFINITION" and parent["func_name"] != "main":
-                return f"return {expression}"
+        values = range(int(start), int(end), int(step))
+        if not 0 < len(values) <= UNROLL_LIMIT or self._writes_variable(node["body"], var_name):
             return ""
-        elif node["type"] == "IF_STATEMENT":
-            # Generate the condition and true branch
-            condition = self.generate_node(node["condition"])
-            true_branch = node["true_branch"]
-            if true_branch["type"] == "BLOCK":
-                body_lines = [self.generate_node(stmt, true_branch["statements"], i, true_branch["statements"])
-                              for i, stmt in enumerate(true_branch["statements"])]
-                true_branch_str = "\n".join(line for line in body_lines if line)
-            else:
-                true_branch_str = self.generate_node(true_branch)
-            true_branch_str = true_branch_str.replace('\n', '\n    ')
-            result = f"if {condition}:\n    {true_branch_str}"
+        outer = self._substitutions
+        parts = []
+        try:
+            for value in values:
+                self._substitutions = {**outer, var_name: str(value)}
+                parts.append(self._gen_body(node["body"], indent))
+        finally:
+            self._substitutions = outer
+        return "\n".join(part for part in parts if part)
+
+    # Reports whether anything under node assigns, declares, increments or reads input into var_name
+    def _writes_variable(self, node, var_name):
+        if isinstance(node, list):
+            return any(self._writes_variable(item, var_name) for item in node)
+        if not isinstance(node, dict):
+            return False
+        node_type = node.get("type")
+        if node_type in WRITE_TYPES and node["var_name"] == var_name:
+            return True
+        if node_type == "IO_STATEMENT" and node["io_operator"] == "cin":
+            if any(expr.get("value") == var_name for expr in node["expressions"]):
+                return True
+        if (node_type == "BINARY_EXPRESSION" and node["operator"] == "=" and
+            node["left"].get("value") == var_name):
+            return True
+        return any(self._writes_variable(child, var_name) for child in node.values())
+
+    # Emits a while loop and its body
+    def _gen_while_loop(self, node, indent):
+        condition_str = self.generate_node(node["condition"])
+        body = self._gen_body(node["body"], indent + 1)
+        return f"{INDENT * indent}while {condition_str}:\n{body}"
+
+    # Converts ++/-- into += 1/-= 1
+    def _gen_increment(self, node, indent):
+        var_name = node["var_name"]
+        if node["operator"] == "++":
+            return f"{var_name} += 1"
+        elif node["operator"] == "--":
+            return f"{var_name} -= 1"
+        else:
+            raise ValueError(f"Unsupported increment operator: {node['operator']}")
 
-            # Handle the false branch recursively for elif and else
-            def process_false_branch(fb_node):
-                nonlocal result
-                if fb_node is None:
-                    return
-                if fb_node["type"] == "IF_STATEMENT":  # Handle else if as elif
-                    next_condition = self.generate_node(fb_node["condition"])
-                    next_true_branch = fb_node["true_branch"]
-                    if next_true_branch["type"] == "BLOCK":
-                        next_body_lines = [self.generate_node(stmt, next_true_branch["statements"], i, next_true_branch["statements"])
-                                           for i, stmt in enumerate(next_true_branch["statements"])]
-                        next_true_branch_str = "\n".join(line for line in next_body_lines if line)
-                    else:
-                        next_true_branch_str = self.generate_node(next_true_branch)
-                    next_true_branch_str = next_true_branch_str.replace('\n', '\n    ')
-                    result += f"\nelif {next_condition}:\n    {next_true_branch_str}"
-                    # Recursively process the next false branch
-                    if "false_branch" in fb_node and fb_node["false_branch"] is not None:
-                        process_false_branch(fb_node["false_branch"])
-                else:  # Handle plain else
-                    if fb_node["type"] == "BLOCK":
-                        body_lines = [self.generate_node(stmt, fb_node["statements"], i, fb_node["statements"])
-                                      for i, stmt in enumerate(fb_node["statements"])]
-                        false_branch_str = "\n".join(line for line in body_lines if line)
-                    else:
-                        false_branch_str = self.generate_node(fb_node)
-                    false_branch_str = false_branch_str.replace('\n', '\n    ')
-                    result += f"\nelse:\n    {false_branch_str}"
+    # Emits a binary expression tree with an explicit work stack, so long operator chains don't recurse
+    def _gen_binary_expression(self, node, indent):
+        results = []
+        work = [(node, False)]
+        while work:
+            current, combine = work.pop()
+            if combine:
+                right = results.pop()
+                left = results.pop()
+                results.append(f"{left} {current['operator']} {right}")
+            elif current["type"] == "BINARY_EXPRESSION":
+                # Operands are pushed right first so the left one is emitted first
+                work.append((current, True))
+                work.append((current["right"], False))
+                work.append((current["left"], False))
+            else:
+                results.append(self.generate_node(current))
+        return results[0]
 
-            # Process the false branch if it exists
-            if "false_branch" in node and node["false_branch"] is not None:
-                process_false_branch(node["false_branch"])
-            return result
+    # Keeps return statements only inside non-main functions
+    def _gen_return_statement(self, node, indent):
+        expression = self.generate_node(node["expression"])
+        parent = self.find_parent(node)
+        if parent and parent["type"] == "FUNCTION_DEFINITION" and parent["func_name"] != "main":
+            return f"{INDENT * indent}return {expression}"
         return ""
 
-    # Looks up a variable's type in the AST if not found by the semantic analyzer
-    def lookup_variable_type(self, var_name, statements, position):
-        if not statements or not isinstance(statements, list):
-            return None
-        for i in range(position - 1, -1, -1):
-            stmt = statements[i]
-            if (isinstance(stmt, dict) and stmt.get("type") == "VARIABLE_DECLARATION" and 
-                stmt.get("var_name") == var_name):
-                return stmt.get("var_type")
-        return None
+    # Emits an if statement with its elif/else chain
+    def _gen_if_statement(self, node, indent):
+        pad = INDENT * indent
+        # Generate the condition and true branch
+        condition = self.generate_node(node["condition"])
+        true_branch_str = self._gen_body(node["true_branch"], indent + 1)
+        parts = [f"{pad}if {condition}:\n{true_branch_str}"]
+
+        # Walk the false branch chain, turning else if into elif and ending at a plain else
+        fb_node = node.get("false_branch")
+        while fb_node is not None:
+            if fb_node["type"] == "IF_STATEMENT":
+                next_condition = self.generate_node(fb_node["condition"])
+                next_true_branch_str = self._gen_body(fb_node["true_branch"], indent + 1)
+                parts.append(f"{pad}elif {next_condition}:\n{next_true_branch_str}")
+                fb_node = fb_node.get("false_branch")
+            else:
+                false_branch_str = self._gen_body(fb_node, indent + 1)
+                parts.append(f"{pad}else:\n{false_branch_str}")
+                fb_node = None
+        return "\n".join(parts)
+
+    # Maps each AST node type to its generator; looked up once per node
+    _HANDLERS = {
+        "PROGRAM": _gen_program,
+        "FUNCTION_DEFINITION": _gen_function_definition,
+        "IO_STATEMENT": _gen_io_statement,
+        "VARIABLE_DECLARATION": _gen_variable_declaration,
+        "ASSIGNMENT": _gen_assignment,
+        "EXPRESSION_STATEMENT": _gen_expression_statement,
+        "FOR_LOOP": _gen_for_loop,
+        "WHILE_LOOP": _gen_while_loop,
+        "INCREMENT": _gen_increment,
+        "BINARY_EXPRESSION": _gen_binary_expression,
+        "RETURN_STATEMENT": _gen_return_statement,
+        "IF_STATEMENT": _gen_if_statement,
+    }
 
-    # Finds the initial value of a variable in the AST
-    def lookup_initial_value(self, var_name, statements, position):
-        if not statements or not isinstance(statements, list):
-            return None
-        for i in range(position - 1, -1, -1):
-            stmt = statements[i]
-            if (isinstance(stmt, dict) and stmt.get("type") == "VARIABLE_DECLARATION" and 
-                stmt.get("var_name") == var_name and "initializer" in stmt):
-                return self.generate_node(stmt["initializer"])
-        return None
+    # Walks the AST once, recording return parents, the declared type each cin reads into and cout -> cin prompt pairs
+    def _prepass(self, node, parent):
+        if node.get("type") == "RETURN_STATEMENT":
+            # Only returns ask for their parent, so only they are recorded
+            self._parent_map[id(node)] = parent
+        children = []
+        for key in ("statements", "true_branch", "false_branch", "left", "right",
+                    "condition", "init", "increment", "initializer", "expression", "expressions"):
+            child = node.get(key)
+            if isinstance(child, list):
+                children.extend(child)
+            elif isinstance(child, dict):
+                children.append(child)
+        body = node.get("body")
+        if isinstance(body, list):
+            children.extend(body)
+        elif isinstance(body, dict):
+            # Loop bodies that are blocks parent their statements to the loop itself
+            children.extend(body["statements"] if "statements" in body else [body])
+        stmts = node["statements"] if "statements" in node else body
+        if isinstance(stmts, dict):
+            # A loop's block body is never visited as a node of its own, so its statements are scanned here
+            stmts = stmts.get("statements")
+        if isinstance(stmts, list):
+            declared = {}  # Types of the declarations seen so far in this statement list
+            previous = None
+            for stmt in stmts:
+                stmt_type = stmt.get("type")
+                if stmt_type == "VARIABLE_DECLARATION":
+                    declared[stmt["var_name"]] = stmt.get("var_type")
+                elif stmt_type == "IO_STATEMENT" and stmt["io_operator"] == "cin":
+                    target = stmt["expressions"][0] if stmt["expressions"] else None
+                    if target is not None and target["type"] == "IDENTIFIER":
+                        self._cin_decls[id(stmt)] = declared.get(target["value"])
+                    if (previous is not None and previous.get("type") == "IO_STATEMENT" and
+                        previous["io_operator"] == "cout"):
+                        self._cout_cin_pairs.add(id(previous))
+                        self._cin_prompts[id(stmt)] = previous
+                previous = stmt
+        for child in children:
+            if isinstance(child, dict):
+                self._prepass(child, node)
 
-    # Locates the parent node of a given node in the AST
+    # Locates the parent node of a return statement recorded by the prepass
     def find_parent(self, node):
-        def search(n, target):
-            if "statements" in n:
-                for stmt in n["statements"]:
-                    if stmt == target:
-                        return n
-                    result = search(stmt, target)
-                    if result:
-                        return result
-            if "body" in n:
-                if isinstance(n["body"], list):
-                    for stmt in n["body"]:
-                        if stmt == target:
-                            return n
-                        result = search(stmt, target)
-                        if result:
-                            return result
-                elif isinstance(n["body"], dict) and "statements" in n["body"]:
-                    for stmt in n["body"]["statements"]:
-                        if stmt == target:
-                            return n
-                        result = search(stmt, target)
-                        if result:
-                            return result
-            return None
-        return search(self.ast, node)
\ No newline at end of file
+        return self._parent_map.get(id(node))
\ No newline at end of file
@@ -1,4 +1,7 @@
 import os
+import re
+import hashlib
+import pathlib
 import google.generativeai as genai
 from dotenv import load_dotenv
 
@@ -17,13 +20,25 @@ generation_config = {
     "response_mime_type": "text/plain",
 }
 
+model_name = "gemini-2.0-flash"
+system_instruction = "Your task is to add short, concise comments to code converted from one programming language to another. Keep comments brief, typically 3-5 words, and avoid lengthy explanations."
+
 # Initialize the Gemini model with an updated system instruction
 model = genai.GenerativeModel(
-    model_name="gemini-2.0-flash",
+    model_name=model_name,
     generation_config=generation_config,
-    system_instruction="Your task is to add short, concise comments to code converted from one programming language to another. Keep comments brief, typically 3-5 words, and avoid lengthy explanations.",
+    system_instruction=system_instruction,
 )
 
+# Commented code from earlier runs, one file per request hash
+CACHE_DIR = pathlib.Path.home() / ".cache" / "capstone" / "gemini"
+
+# Everything besides the prompt that shapes a response, so changing any of it invalidates old entries
+_CACHE_SALT = "\0".join((model_name, repr(sorted(generation_config.items())), system_instruction))
+
+# Code block markers and bare language tags stripped from responses in one pass
+_CLEANUP_RE = re.compile(r'```(?:cpp|python|c\+\+)?|\b(?:cpp|python)\b')
+
 def add_ai_comments(code, target_language):
     """
     Sends converted code to Gemini API and returns commented code without language identifiers.
@@ -32,8 +47,6 @@ def add_ai_comments(code, target_language):
     :param target_language: The language of the code ('python' or 'c++').
     :return: Commented code as a string.
     """
-    chat_session = model.start_chat(history=[])  # Start a new chat session
-    
     # Construct the prompt based on the target language with emphasis on brevity
     if target_language.lower() == 'python':
         prompt = f"Add short, concise comments (3-5 words max) to this Python code:\n{code}"
@@ -42,12 +55,20 @@ def add_ai_comments(code, target_language):
     else:
         raise ValueError("Unsupported language for commenting")
 
-    response = chat_session.send_message(prompt)
+    # Reuse the response from an earlier run on the same code instead of calling the API again
+    key = hashlib.sha256((_CACHE_SALT + "\0" + prompt).encode()).hexdigest()
+    cache_path = CACHE_DIR / f"{key}.txt"
+    if cache_path.exists():
+        return cache_path.read_text(encoding="utf-8")
+
+    # Stream the one-shot request and collect chunks as they arrive
+    response = model.generate_content(prompt, stream=True)
+    response_text = "".join(chunk.text for chunk in response)
     # Clean up the response by removing code block markers and language identifiers
-    commented_code = response.text
-    # Remove common code block markers and language tags
-    for marker in ["```cpp", "```python", "```c++", "```", "cpp", "python"]:
-        commented_code = commented_code.replace(marker, "").strip()
-   
-    commented_code = commented_code.strip()
+    commented_code = _CLEANUP_RE.sub("", response_text).strip()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(commented_code, encoding="utf-8")
+    except OSError:
+        pass  # An unwritable cache only costs the next run another API call
     return commented_code 
\ No newline at end of file
@@ -1,10 +1,11 @@
 import re
+import sys
 
 # Define token types with regex patterns
 TOKEN_TYPES = [
-    ('KEYWORD', r'\b(int|float|double|bool|char|string|void|if|else|while|for|return|using|namespace|include)\b'),  # C++ keywords
+    ('KEYWORD', r'\b(?:int|float|double|bool|char|string|void|if|else|while|for|return|using|namespace|include)\b'),  # C++ keywords
     ('IDENTIFIER', r'\b[a-zA-Z_][a-zA-Z0-9_]*\b'),  # Variable/function names
-    ('NUMBER', r'\b\d+(\.\d*)?\b'),                  # Integer or float numbers
+    ('NUMBER', r'\b\d+(?:\.\d*)?\b'),                # Integer or float numbers
     ('INSERTION_OPERATOR', r'>>|<<'),                # C++ I/O operators
     ('RELATIONAL_OPERATOR', r'<=|>=|==|!=|<|>'),     # Comparison operators
     ('COMPOUND_ASSIGNMENT', r'\+=|-=|\*=|/='),   # Compound assignment operators
@@ -21,37 +22,127 @@ TOKEN_TYPES = [
     ('WHITESPACE', r'\s+'),                          # Whitespace (ignored)
 ]
 
+# Words named in a KEYWORD pattern, skipping regex escapes such as \b
+def _pattern_keywords(token_types):
+    keyword_pattern = next((p for n, p in token_types if n == 'KEYWORD'), r'')
+    return frozenset(re.findall(r'(?<![\\\w])\w+', keyword_pattern))
+
+# Default token set compiled once at import and shared by every Lexer
+_DEFAULT_KEYWORDS = _pattern_keywords(TOKEN_TYPES)  # e.g., {'int', 'if', ...}
+_COMPILED_TOKEN_TYPES = [(name, re.compile(pattern)) for name, pattern in TOKEN_TYPES]
+_MASTER_PATTERN = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in TOKEN_TYPES))
+
+# Operator and punctuation characters of TOKEN_TYPES: first char -> ({two-char token: type}, single-char type)
+_OPERATORS = {
+    '<': ({'<<': 'INSERTION_OPERATOR', '<=': 'RELATIONAL_OPERATOR'}, 'RELATIONAL_OPERATOR'),
+    '>': ({'>>': 'INSERTION_OPERATOR', '>=': 'RELATIONAL_OPERATOR'}, 'RELATIONAL_OPERATOR'),
+    '=': ({'==': 'RELATIONAL_OPERATOR'}, 'ARITHMETIC_OPERATOR'),
+    '!': ({'!=': 'RELATIONAL_OPERATOR'}, 'SPECIAL_CHARACTER'),
+    '+': ({'+=': 'COMPOUND_ASSIGNMENT', '++': 'ARITHMETIC_OPERATOR'}, 'ARITHMETIC_OPERATOR'),
+    '-': ({'-=': 'COMPOUND_ASSIGNMENT', '--': 'ARITHMETIC_OPERATOR'}, 'ARITHMETIC_OPERATOR'),
+    '*': ({'*=': 'COMPOUND_ASSIGNMENT'}, 'ARITHMETIC_OPERATOR'),
+    '/': ({'/=': 'COMPOUND_ASSIGNMENT'}, 'ARITHMETIC_OPERATOR'),
+    '%': ({}, 'ARITHMETIC_OPERATOR'),
+    ';': ({}, 'SEMICOLON'),
+    ',': ({}, 'COMMA'),
+    '{': ({}, 'LBRACE'),
+    '}': ({}, 'RBRACE'),
+    '(': ({}, 'LPAREN'),
+    ')': ({}, 'RPAREN'),
+    "'": ({}, 'APOSTROPHE'),
+}
+_OPERATORS.update((char, ({}, 'SPECIAL_CHARACTER')) for char in '@#$^&?~')
+
+# Multi-character tokens of TOKEN_TYPES: first char -> (token type, pattern scanning the whole token)
+_SCANNERS = {}
+_SCANNERS.update((char, ('IDENTIFIER', re.compile(r'\b[a-zA-Z_][a-zA-Z0-9_]*\b')))
+                 for char in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_')
+_SCANNERS.update((char, ('NUMBER', re.compile(r'\b\d+(?:\.\d*)?\b'))) for char in '0123456789')
+_SCANNERS.update((char, ('WHITESPACE', re.compile(r'\s+'))) for char in ' \t\n\r\f\v')
+_SCANNERS['"'] = ('STRING', re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"'))
+
 # Lexer class to tokenize C++-like source code
 class Lexer:
     def __init__(self, token_types=TOKEN_TYPES, keywords=None):
+        # The character-dispatch scanner only knows the default token set
+        self.use_scanner = token_types is TOKEN_TYPES
         # Extract keywords from TOKEN_TYPES if not provided
         if keywords is None:
-            keyword_pattern = next((p for n, p in token_types if n == 'KEYWORD'), r'')
-            self.keywords = set(re.findall(r'\w+', keyword_pattern))  # e.g., {'int', 'if', ...}
+            self.keywords = _DEFAULT_KEYWORDS if self.use_scanner else _pattern_keywords(token_types)
         else:
             self.keywords = set(keywords)  # Custom keyword set
-        # Compile regex patterns for token matching
-        self.token_types = [(name, re.compile(pattern)) for name, pattern in token_types]
+        if self.use_scanner:
+            self.token_types = _COMPILED_TOKEN_TYPES
+            self.master_pattern = _MASTER_PATTERN
+        else:
+            # Compile regex patterns for token matching
+            self.token_types = [(name, re.compile(pattern)) for name, pattern in token_types]
+            # Single alternation of every pattern; alternatives are tried in token_types order
+            self.master_pattern = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in token_types))
     
     # Convert source string into a list of tokens
     def tokenize(self, contents):
+        if self.use_scanner:
+            return self.scan(contents)
         position = 0  # Current position in source string
         tokens = []   # List to store token tuples (type, value)
-        while position < len(contents):
+        for match in self.master_pattern.finditer(contents):
+            if match.start() != position:
+                break  # Skipped over characters no token type matches
+            name = sys.intern(match.lastgroup)  # Parsers compare type tags by identity
+            value = match.group()
+            # Special handling for identifiers that are keywords; names are interned so repeats share one string
+            if name == 'IDENTIFIER' or name == 'KEYWORD':
+                value = sys.intern(value)
+                tokens.append(('KEYWORD' if value in self.keywords else name, value))
+            elif name != 'WHITESPACE':  # Skip whitespace
+                tokens.append((name, value))
+            position = match.end()  # Move to end of matched token
+        if position < len(contents):
+            # Raise error with context if no token matches
+            raise ValueError(f"Unable to match contents at position {position}: '{contents[position:position+10]}...'")
+        return tokens  # Return list of tokens
+
+    # Scan the default token set by dispatching on each token's first character
+    def scan(self, contents):
+        keywords = self.keywords | _DEFAULT_KEYWORDS
+        operators = _OPERATORS
+        scanners = _SCANNERS
+        master_match = self.master_pattern.match
+        position = 0
+        length = len(contents)
+        tokens = []
+        append = tokens.append
+        intern = sys.intern
+        while position < length:
+            char = contents[position]
+            operator = operators.get(char)
+            if operator is not None:
+                pairs, name = operator
+                pair = contents[position:position + 2]
+                if pair in pairs:
+                    append((pairs[pair], pair))
+                    position += 2
+                else:
+                    append((name, char))
+                    position += 1
+                continue
+            scanner = scanners.get(char)
             match = None
-            # Try matching each token type at current position
-            for name, pattern in self.token_types:
+            if scanner is not None:
+                name, pattern = scanner
                 match = pattern.match(contents, position)
-                if match:
-                    value = match.group(0)
-                    # Special handling for identifiers that are keywords
-                    if name == 'IDENTIFIER' and value in self.keywords:
-                        tokens.append(('KEYWORD', value))
-                    elif name != 'WHITESPACE':  # Skip whitespace
-                        tokens.append((name, value))
-                    position = match.end()  # Move to end of matched token
-                    break
-            if not match:
-                # Raise error with context if no token matches
+            if match is None:
+                # Characters outside the table (e.g. non-ASCII) or a failed scan go through the full alternation
+                match = master_match(contents, position)
+                name = match and sys.intern(match.lastgroup)
+            if match is None:
                 raise ValueError(f"Unable to match contents at position {position}: '{contents[position:position+10]}...'")
-        return tokens  # Return list of tokens
\ No newline at end of file
+            value = match.group()
+            if name == 'IDENTIFIER':
+                value = intern(value)
+                append(('KEYWORD' if value in keywords else name, value))
+            elif name != 'WHITESPACE':
+                append((name, value))
+            position = match.end()
+        return tokens
\ No newline at end of file
@@ -10,16 +10,25 @@ from geminiAPI import add_ai_comments
 def process_file(file_path, source_language, target_language, verbose=False, add_comments=True):
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file {file_path} does not exist.")
+    return _process(file_path, None, source_language, target_language, verbose, add_comments)
+
+# Same as process_file for source code already in memory, such as text typed into the UI
+def process_source(contents, source_language, target_language, verbose=False, add_comments=True):
+    return _process(None, contents, source_language, target_language, verbose, add_comments)
+
+# Shared pipeline; contents is read from file_path when not given
+def _process(file_path, contents, source_language, target_language, verbose, add_comments):
     keywords = {
         'c++': ['int', 'float', 'double', 'bool', 'if', 'else', 'for', 'while', 'return', 'void', 'using', 'namespace', 'include', 'string']
     }.get(source_language, [])
     try:
-        if verbose:
-            print(f"Reading file: {file_path}")
-        with open(file_path, 'r') as file:
-            contents = file.read()
-        if verbose:
-            print("File contents read successfully.")
+        if contents is None:
+            if verbose:
+                print(f"Reading file: {file_path}")
+            with open(file_path, 'r') as file:
+                contents = file.read()
+            if verbose:
+                print("File contents read successfully.")
         if verbose:
             print("Running lexer...")
         lexer = Lexer(TOKEN_TYPES, keywords)
@@ -2,6 +2,7 @@ import os
 import json
 from python_lexer import PythonLexer
 from python_parser import PythonParser
+from ast_nodes import Node
 from python_semantic_analyzer import PythonSemanticAnalyzer
 from python_to_cpp_converter import PythonToCppConverter
 from geminiAPI import add_ai_comments
@@ -15,13 +16,22 @@ def process_file(file_path, source_language, target_language, verbose=False):
         raise ValueError("File path cannot be None.")
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file {file_path} does not exist.")
+    return _process(file_path, None, source_language, target_language, verbose)
 
+# Same as process_file for source code already in memory, such as text typed into the UI
+def process_source(contents, source_language, target_language, verbose=False):
+    return _process(None, contents, source_language, target_language, verbose)
+
+# Shared pipeline; contents is read from file_path when not given
+def _process(file_path, contents, source_language, target_language, verbose):
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            contents = file.read()
+        if contents is None:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                contents = file.read()
+            if verbose:
+                print(f"Reading file: {file_path}")
         
         if verbose:
-            print(f"Reading file: {file_path}")
             print(f"Content being tokenized:\n{contents[:100]}{'...' if len(contents) > 100 else ''}")
 
         if source_language == 'python' and target_language == 'c++':
@@ -37,7 +47,7 @@ def process_file(file_path, source_language, target_language, verbose=False):
             if verbose:
                 print("\nRunning parser...")
                 print("\nAbstract Syntax Tree (AST):")
-                print(json.dumps(ast, indent=4))
+                print(json.dumps(ast, indent=4, default=Node.to_dict))
 
             semantic_analyzer = PythonSemanticAnalyzer()
             errors = semantic_analyzer.analyze(ast)
@@ -50,7 +60,7 @@ def process_file(file_path, source_language, target_language, verbose=False):
                 else:
                     print("\nSemantic analysis completed without errors.")
 
-            converter = PythonToCppConverter(ast)
+            converter = PythonToCppConverter(ast, verbose=verbose)
             converted_code = converter.generate_code()
             if verbose:
                 print(f"\nRunning code converter... Type of converted_code: {type(converted_code)}")
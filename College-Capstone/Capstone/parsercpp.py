@@ -1,327 +1,441 @@
-import json
+import os
+import sys
+
+# Token type tags, interned so dispatch can compare them by identity. Kept as strings rather than
+# IntEnum members: interned strings skip reference counting on 3.12+ and compare faster with `is`
+KEYWORD = sys.intern('KEYWORD')
+IDENTIFIER = sys.intern('IDENTIFIER')
+NUMBER = sys.intern('NUMBER')
+STRING = sys.intern('STRING')
+LPAREN = sys.intern('LPAREN')
+RPAREN = sys.intern('RPAREN')
+LBRACE = sys.intern('LBRACE')
+RBRACE = sys.intern('RBRACE')
+SEMICOLON = sys.intern('SEMICOLON')
+COMMA = sys.intern('COMMA')
+ARITHMETIC_OPERATOR = sys.intern('ARITHMETIC_OPERATOR')
+COMPOUND_ASSIGNMENT = sys.intern('COMPOUND_ASSIGNMENT')
+RELATIONAL_OPERATOR = sys.intern('RELATIONAL_OPERATOR')
+INSERTION_OPERATOR = sys.intern('INSERTION_OPERATOR')
+EOF = sys.intern('EOF')  # Type of the sentinel token that ends every token list
+
+# Token sets tested with membership during parsing
+_TYPE_KEYWORDS = frozenset(('int', 'float', 'double', 'bool', 'char', 'string', 'void'))
+_INCDEC = frozenset(('++', '--'))
+_IO_STREAMS = frozenset(('cout', 'cin'))
+_IO_OPERAND_TYPES = frozenset((STRING, IDENTIFIER, NUMBER, LPAREN))
+_EXPRESSION_END_TYPES = frozenset((SEMICOLON, LBRACE, RBRACE))
+_BLOCK_END_TYPES = frozenset((RBRACE, EOF))
+
+# What Parser._classify_decl finds at the start of a statement
+_OTHER_STATEMENT = 0
+_FUNCTION_DEFINITION = 1
+_VARIABLE_DECLARATION = 2
+
+# Binding power of each binary operator, higher binds tighter; anything else ends the expression
+_BINDING_POWER = {
+    '*': 50, '/': 50, '%': 50,
+    '+': 40, '-': 40,
+    '<': 30, '<=': 30, '>': 30, '>=': 30,
+    '==': 20, '!=': 20,
+    '=': 10,
+}
+_RIGHT_ASSOCIATIVE = frozenset(('=',))
+
+# Build `x;`, `x = 1;` and `x = y;` statements straight from their tokens; PARSERCPP_FAST_PATHS=0
+# sends them through the general statement and expression parsers to check the two agree
+_FAST_PATHS = os.environ.get('PARSERCPP_FAST_PATHS', '1') not in ('', '0')
 
 class Parser:
     def __init__(self, tokens):
-        self.tokens = tokens
+        # The EOF sentinel means lookahead never runs off the end of the list
+        # Types and values live in parallel lists; dispatch reads only the type list
+        self.types = [token[0] for token in tokens]
+        self.values = [token[1] for token in tokens]
+        self.types.append(EOF)
+        self.values.append(None)
         self.position = 0
-        self.statement_parser = StatementParser(self)
+        # The expression parser comes first so the statement parser can bind its methods
         self.expression_parser = ExpressionParser(self)
+        self.statement_parser = StatementParser(self)
 
-    def current_token(self):
-        return self.tokens[self.position] if self.position < len(self.tokens) else None
-
+    # Consume a token of the expected type and return its value
     def match(self, expected_type):
-        token = self.current_token()
-        if token and token[0] == expected_type:
-            self.position += 1
-            return token
+        position = self.position
+        token_type = self.types[position]
+        if token_type is expected_type:
+            self.position = position + 1
+            return self.values[position]
         else:
-            raise ValueError(f"Expected {expected_type} but got {token}")
+            raise ValueError(f"Expected {expected_type} but got {(token_type, self.values[position]) if token_type is not EOF else None}")
 
     def parse_program(self):
         statements = []
-        while self.current_token():
-            if self.is_function_definition():
-                statements.append(self.statement_parser.parse_function_definition())
+        statement_parser = self.statement_parser
+        while self.types[self.position] is not EOF:
+            kind = self._classify_decl()
+            if kind == _FUNCTION_DEFINITION:
+                statements.append(statement_parser.parse_function_definition())
+            elif kind == _VARIABLE_DECLARATION:
+                statements.append(statement_parser.parse_variable_declaration())
             else:
-                statements.append(self.statement_parser.parse_statement())
+                statements.append(statement_parser.parse_statement())
         return {'type': 'PROGRAM', 'statements': statements}
 
-    def is_function_definition(self):
-        if (
-            self.current_token()
-            and self.current_token()[0] == 'KEYWORD'
-            and self.current_token()[1] in ['int', 'float', 'void']
-        ):
-            next_token = self.tokens[self.position + 1] if self.position + 1 < len(self.tokens) else None
-            if next_token and next_token[0] == 'IDENTIFIER':
-                next_next_token = self.tokens[self.position + 2] if self.position + 2 < len(self.tokens) else None
-                if next_next_token and next_next_token[0] == 'LPAREN':
-                    return True
-        return False
+    # Type of the token k places ahead; the EOF sentinel keeps lookahead in bounds
+    def _type_at(self, k):
+        return self.types[self.position + k]
+
+    # Classify `type name (` as a function definition and `type name` as a variable declaration in one look
+    def _classify_decl(self):
+        types = self.types
+        position = self.position
+        if types[position] is KEYWORD and self.values[position] in _TYPE_KEYWORDS and types[position + 1] is IDENTIFIER:
+            return _FUNCTION_DEFINITION if types[position + 2] is LPAREN else _VARIABLE_DECLARATION
+        return _OTHER_STATEMENT
 
 
 class StatementParser:
     def __init__(self, parser):
         self.parser = parser
+        # Bound once so hot call sites skip the attribute chain through the parser
+        self.match = parser.match
+        self._type_at = parser._type_at
+        self._classify_decl = parser._classify_decl
+        self.parse_expression = parser.expression_parser.parse_expression
+        # Statement keywords mapped to their parse methods
+        self._kw_dispatch = {
+            'if': self.parse_if_statement,
+            'while': self.parse_while_loop,
+            'for': self.parse_for_loop,
+            'return': self.parse_return_statement,
+        }
+        # Statements starting with an identifier, keyed on the type of the token after it
+        self._after_identifier = {
+            LPAREN: self.parse_function_call,
+            COMPOUND_ASSIGNMENT: self.parse_assignment,
+        }
 
     def parse_statement(self):
-        token = self.parser.current_token()
-        if not token:
+        types = self.parser.types
+        position = self.parser.position
+        token_type = types[position]
+        values = self.parser.values
+        token_value = values[position]
+        if token_type is EOF:
             raise SyntaxError("Unexpected end of input while parsing statement")
-        token_type, token_value = token
-        if token_type == 'KEYWORD':
-            if token_value == 'if':
-                return self.parse_if_statement()
-            elif token_value == 'while':
-                return self.parse_while_loop()
-            elif token_value == 'for':
-                return self.parse_for_loop()
-            elif token_value == 'return':
-                return self.parse_return_statement()
-            elif token_value in ['int', 'float', 'double', 'bool', 'char', 'string', 'void']:
-                next_token = self.parser.tokens[self.parser.position + 1] if self.parser.position + 1 < len(self.parser.tokens) else None
-                if next_token and next_token[0] == 'IDENTIFIER':
-                    next_next_token = self.parser.tokens[self.parser.position + 2] if self.parser.position + 2 < len(self.parser.tokens) else None
-                    if next_next_token and next_next_token[0] == 'LPAREN':
-                        return self.parse_function_definition()
-                    else:
-                        return self.parse_variable_declaration()
+        if token_type is KEYWORD:
+            handler = self._kw_dispatch.get(token_value)
+            if handler is not None:
+                return handler()
+            elif token_value in _TYPE_KEYWORDS:
+                kind = self._classify_decl()
+                if kind == _FUNCTION_DEFINITION:
+                    return self.parse_function_definition()
+                elif kind == _VARIABLE_DECLARATION:
+                    return self.parse_variable_declaration()
                 else:
                     raise SyntaxError(f"Expected identifier after type '{token_value}'")
             else:
                 raise SyntaxError(f"Unsupported keyword: {token_value}")
-        elif token_type == 'IDENTIFIER':
-            next_token = self.parser.tokens[self.parser.position + 1] if self.parser.position + 1 < len(self.parser.tokens) else None
-            if next_token and next_token[0] == 'LPAREN':
-                return self.parse_function_call()
-            elif next_token and next_token[0] == 'ARITHMETIC_OPERATOR' and next_token[1] in ['++', '--']:
-                return self.parse_expression_statement()
-            elif next_token and next_token[0] in ['ARITHMETIC_OPERATOR', 'COMPOUND_ASSIGNMENT'] and next_token[1] not in ['++', '--']:
-                return self.parse_assignment()
-            elif token_value in ['cout', 'cin']:
+        elif token_type is IDENTIFIER:
+            next_type = types[position + 1]
+            if _FAST_PATHS:
+                statement = self._parse_simple_statement(types, values, position, next_type)
+                if statement is not None:
+                    return statement
+            if next_type is ARITHMETIC_OPERATOR:
+                # x++ / x-- is an expression statement; any other operator starts an assignment
+                return self.parse_expression_statement() if values[position + 1] in _INCDEC else self.parse_assignment()
+            handler = self._after_identifier.get(next_type)
+            if handler is not None:
+                return handler()
+            elif token_value in _IO_STREAMS:
                 return self.parse_io_statement()
             else:
                 return self.parse_expression_statement()
-        elif token_type == 'NUMBER':
+        elif token_type is NUMBER:
             return self.parse_expression_statement()
-        elif token_type == 'LBRACE':
+        elif token_type is LBRACE:
             return self.parse_block()
-        elif token_type == 'SEMICOLON':
-            self.parser.match('SEMICOLON')
+        elif token_type is SEMICOLON:
+            self.match(SEMICOLON)
             return {'type': 'EMPTY_STATEMENT'}
         else:
             raise SyntaxError(f"Unexpected token: {token_type} {token_value}")
 
+    # Shortcut for the most common statement shapes; returns None when the tokens don't fit one
+    def _parse_simple_statement(self, types, values, position, next_type):
+        name = values[position]
+        if next_type is SEMICOLON:
+            if name in _IO_STREAMS:
+                return None  # `cout;` is an empty I/O statement
+            self.parser.position = position + 2
+            return {'type': 'EXPRESSION_STATEMENT', 'expression': {'type': 'IDENTIFIER', 'value': name}}
+        if next_type is ARITHMETIC_OPERATOR and values[position + 1] == '=':
+            # A NUMBER or IDENTIFIER value is not the EOF sentinel, so the token after it exists
+            value_type = types[position + 2]
+            if value_type is NUMBER:
+                value = {'type': 'NUMBER', 'value': values[position + 2]}
+            elif value_type is IDENTIFIER:
+                value = {'type': 'IDENTIFIER', 'value': values[position + 2]}
+            else:
+                return None
+            if types[position + 3] is not SEMICOLON:
+                return None
+            self.parser.position = position + 4
+            return {'type': 'ASSIGNMENT', 'var_name': name, 'expression': value}
+        return None
+
     def parse_function_definition(self):
-        return_type = self.parser.match('KEYWORD')[1]
-        func_name = self.parser.match('IDENTIFIER')[1]
-        self.parser.match('LPAREN')
-        self.parser.match('RPAREN')
+        return_type = self.match(KEYWORD)
+        func_name = self.match(IDENTIFIER)
+        self.match(LPAREN)
+        self.match(RPAREN)
         body = self.parse_block()
-        return {
-            'type': 'FUNCTION_DEFINITION',
-            'return_type': return_type,
-            'func_name': func_name,
-            'body': body['statements']
-        }
+        return {'type': 'FUNCTION_DEFINITION', 'return_type': return_type, 'func_name': func_name, 'body': body['statements']}
 
     def parse_assignment(self):
-        var_name = self.parser.match('IDENTIFIER')[1]
-        next_token = self.parser.current_token()
-        if next_token and next_token[0] == 'ARITHMETIC_OPERATOR' and next_token[1] == '=':
-            self.parser.match('ARITHMETIC_OPERATOR')
-            expression = self.parser.expression_parser.parse_expression()
-            self.parser.match('SEMICOLON')
+        parser = self.parser
+        values = parser.values  # Hoisted so the JIT sees one load per method, not one per peek
+        var_name = self.match(IDENTIFIER)
+        next_type = self._type_at(0)
+        if next_type is ARITHMETIC_OPERATOR and values[parser.position] == '=':
+            self.match(ARITHMETIC_OPERATOR)
+            expression = self.parse_expression()
+            self.match(SEMICOLON)
             return {'type': 'ASSIGNMENT', 'var_name': var_name, 'expression': expression}
-        elif next_token and next_token[0] == 'COMPOUND_ASSIGNMENT':
-            operator = self.parser.match('COMPOUND_ASSIGNMENT')[1]
-            right_expr = self.parser.expression_parser.parse_expression()
-            self.parser.match('SEMICOLON')
+        elif next_type is COMPOUND_ASSIGNMENT:
+            operator = self.match(COMPOUND_ASSIGNMENT)
+            right_expr = self.parse_expression()
+            self.match(SEMICOLON)
             return {
                 'type': 'ASSIGNMENT',
                 'var_name': var_name,
-                'expression': {
-                    'type': 'BINARY_EXPRESSION',
-                    'operator': operator[0],
-                    'left': {'type': 'IDENTIFIER', 'value': var_name},
-                    'right': right_expr
-                }
+                'expression': {'type': 'BINARY_EXPRESSION', 'operator': operator[0],
+                               'left': {'type': 'IDENTIFIER', 'value': var_name}, 'right': right_expr},
             }
         else:
             raise SyntaxError(f"Expected '=' or compound assignment operator after identifier '{var_name}' in assignment")
 
     def parse_expression_statement(self):
-        expression = self.parser.expression_parser.parse_expression()
-        self.parser.match('SEMICOLON')
+        expression = self.parse_expression()
+        self.match(SEMICOLON)
         return {'type': 'EXPRESSION_STATEMENT', 'expression': expression}
 
     def parse_while_loop(self):
-        self.parser.match('KEYWORD')
-        self.parser.match('LPAREN')
-        condition = self.parser.expression_parser.parse_expression()
-        self.parser.match('RPAREN')
+        self.match(KEYWORD)
+        self.match(LPAREN)
+        condition = self.parse_expression()
+        self.match(RPAREN)
         body = self.parse_statement()
-        return {
-            'type': 'WHILE_LOOP',
-            'condition': condition,
-            'body': body
-        }
+        return {'type': 'WHILE_LOOP', 'condition': condition, 'body': body}
 
     def parse_for_loop(self):
-        self.parser.match('KEYWORD')  # 'for'
-        self.parser.match('LPAREN')
+        parser = self.parser
+        values = parser.values
+        self.match(KEYWORD)  # 'for'
+        self.match(LPAREN)
         init = None
-        if self.parser.current_token()[0] == 'KEYWORD':
-            init_type = self.parser.match('KEYWORD')[1]
-            var_name = self.parser.match('IDENTIFIER')[1]
-            self.parser.match('ARITHMETIC_OPERATOR')  # Expect '='
-            start_value = self.parser.expression_parser.parse_expression()
+        if self._type_at(0) is KEYWORD:
+            init_type = self.match(KEYWORD)
+            var_name = self.match(IDENTIFIER)
+            self.match(ARITHMETIC_OPERATOR)  # Expect '='
+            start_value = self.parse_expression()
             init = {'type': 'VARIABLE_DECLARATION', 'var_type': init_type, 'var_name': var_name, 'initializer': start_value}
-        elif self.parser.current_token()[0] == 'IDENTIFIER':
-            var_name = self.parser.match('IDENTIFIER')[1]
-            self.parser.match('ARITHMETIC_OPERATOR')  # Expect '='
-            start_value = self.parser.expression_parser.parse_expression()
+        elif self._type_at(0) is IDENTIFIER:
+            var_name = self.match(IDENTIFIER)
+            self.match(ARITHMETIC_OPERATOR)  # Expect '='
+            start_value = self.parse_expression()
             init = {'type': 'ASSIGNMENT', 'var_name': var_name, 'expression': start_value}
         else:
             raise SyntaxError("For loop initialization must start with a type or identifier")
-        self.parser.match('SEMICOLON')
+        self.match(SEMICOLON)
         condition = None
-        if self.parser.current_token()[0] != 'SEMICOLON':
-            condition = self.parser.expression_parser.parse_expression()
+        if self._type_at(0) is not SEMICOLON:
+            condition = self.parse_expression()
         else:
             condition = {'type': 'BOOLEAN_LITERAL', 'value': 'true'}
-        self.parser.match('SEMICOLON')
+        self.match(SEMICOLON)
         increment = None
-        if self.parser.current_token()[0] != 'RPAREN':
-            if self.parser.current_token()[0] == 'IDENTIFIER':
-                inc_var = self.parser.match('IDENTIFIER')[1]
-                next_token = self.parser.current_token()
-                if next_token[0] == 'ARITHMETIC_OPERATOR' and next_token[1] in ['++', '--']:
-                    operator = self.parser.match('ARITHMETIC_OPERATOR')[1]
+        if self._type_at(0) is not RPAREN:
+            if self._type_at(0) is IDENTIFIER:
+                inc_var = self.match(IDENTIFIER)
+                next_type = self._type_at(0)
+                next_value = values[parser.position]
+                if next_type is ARITHMETIC_OPERATOR and next_value in _INCDEC:
+                    operator = self.match(ARITHMETIC_OPERATOR)
                     increment = {'type': 'INCREMENT', 'var_name': inc_var, 'operator': operator}
-                elif next_token[0] == 'ARITHMETIC_OPERATOR' and next_token[1] == '=':
-                    self.parser.match('ARITHMETIC_OPERATOR')
-                    expression = self.parser.expression_parser.parse_expression()
+                elif next_type is ARITHMETIC_OPERATOR and next_value == '=':
+                    self.match(ARITHMETIC_OPERATOR)
+                    expression = self.parse_expression()
                     increment = {'type': 'ASSIGNMENT', 'var_name': inc_var, 'expression': expression}
-                elif next_token[0] == 'COMPOUND_ASSIGNMENT':
-                    operator = self.parser.match('COMPOUND_ASSIGNMENT')[1]
-                    expression = self.parser.expression_parser.parse_expression()
+                elif next_type is COMPOUND_ASSIGNMENT:
+                    operator = self.match(COMPOUND_ASSIGNMENT)
+                    expression = self.parse_expression()
                     increment = {
                         'type': 'ASSIGNMENT',
                         'var_name': inc_var,
-                        'expression': {
-                            'type': 'BINARY_EXPRESSION',
-                            'operator': operator[0],
-                            'left': {'type': 'IDENTIFIER', 'value': inc_var},
-                            'right': expression
-                        }
+                        'expression': {'type': 'BINARY_EXPRESSION', 'operator': operator[0],
+                                       'left': {'type': 'IDENTIFIER', 'value': inc_var}, 'right': expression},
                     }
                 else:
-                    raise SyntaxError(f"Unexpected token after increment variable: {next_token}")
-        self.parser.match('RPAREN')
+                    raise SyntaxError(f"Unexpected token after increment variable: {(next_type, next_value)}")
+        self.match(RPAREN)
         body = self.parse_statement()
-        return {
-            'type': 'FOR_LOOP',
-            'init': init,
-            'condition': condition,
-            'increment': increment,
-            'body': body
-        }
+        return {'type': 'FOR_LOOP', 'init': init, 'condition': condition, 'increment': increment, 'body': body}
 
     def parse_if_statement(self):
-        self.parser.match('KEYWORD')
-        self.parser.match('LPAREN')
-        condition = self.parser.expression_parser.parse_expression()
-        self.parser.match('RPAREN')
-        true_branch = self.parse_statement()
+        # Parse the if / else if rungs in a loop, then nest them from the last rung outwards
+        parser = self.parser
+        types = parser.types
+        values = parser.values
+        rungs = []
         false_branch = None
-        if self.parser.current_token() and self.parser.current_token()[1] == 'else':
-            self.parser.match('KEYWORD')
-            if self.parser.current_token() and self.parser.current_token()[0] == 'KEYWORD' and self.parser.current_token()[1] == 'if':
-                false_branch = self.parse_if_statement()
-            else:
+        while True:
+            self.match(KEYWORD)
+            self.match(LPAREN)
+            condition = self.parse_expression()
+            self.match(RPAREN)
+            rungs.append((condition, self.parse_statement()))
+            if values[parser.position] != 'else':
+                break
+            self.match(KEYWORD)
+            if not (types[parser.position] is KEYWORD and values[parser.position] == 'if'):
                 false_branch = self.parse_statement()
-        return {
-            'type': 'IF_STATEMENT',
-            'condition': condition,
-            'true_branch': true_branch,
-            'false_branch': false_branch
-        }
+                break
+        for condition, true_branch in reversed(rungs):
+            false_branch = {'type': 'IF_STATEMENT', 'condition': condition, 'true_branch': true_branch, 'false_branch': false_branch}
+        return false_branch
 
     def parse_block(self):
-        self.parser.match('LBRACE')
+        parser = self.parser
+        types = parser.types
+        parser.match(LBRACE)
         statements = []
-        while self.parser.current_token() and self.parser.current_token()[0] != 'RBRACE':
+        while types[parser.position] not in _BLOCK_END_TYPES:
             statements.append(self.parse_statement())
-        self.parser.match('RBRACE')
+        parser.match(RBRACE)
         return {'type': 'BLOCK', 'statements': statements}
 
     def parse_io_statement(self):
-        io_operator = self.parser.match('IDENTIFIER')[1]
+        io_operator = self.match(IDENTIFIER)
         expressions = []
-        while self.parser.current_token() and self.parser.current_token()[0] == 'INSERTION_OPERATOR':
-            self.parser.match('INSERTION_OPERATOR')
-            if self.parser.current_token()[0] in ['STRING', 'IDENTIFIER', 'NUMBER', 'LPAREN']:
-                expression = self.parser.expression_parser.parse_expression()
+        while self._type_at(0) is INSERTION_OPERATOR:
+            self.match(INSERTION_OPERATOR)
+            if self._type_at(0) in _IO_OPERAND_TYPES:
+                expression = self.parse_expression()
                 expressions.append(expression)
             else:
                 raise SyntaxError(f"Expected expression after '{io_operator} <<'")
-        self.parser.match('SEMICOLON')
-        return {
-            'type': 'IO_STATEMENT',
-            'io_operator': io_operator,
-            'expressions': expressions
-        }
+        self.match(SEMICOLON)
+        return {'type': 'IO_STATEMENT', 'io_operator': io_operator, 'expressions': expressions}
 
     def parse_return_statement(self):
-        self.parser.match('KEYWORD')
-        expression = self.parser.expression_parser.parse_expression()
-        self.parser.match('SEMICOLON')
-        return {
-            'type': 'RETURN_STATEMENT',
-            'expression': expression
-        }
+        self.match(KEYWORD)
+        expression = self.parse_expression()
+        self.match(SEMICOLON)
+        return {'type': 'RETURN_STATEMENT', 'expression': expression}
 
     def parse_variable_declaration(self):
-        if self.parser.current_token()[1] in ['int', 'float', 'double', 'bool', 'char', 'string', 'void']:
-            var_type = self.parser.match('KEYWORD')[1]
-            var_name = self.parser.match('IDENTIFIER')[1]
-            if self.parser.current_token() and self.parser.current_token()[0] == 'ARITHMETIC_OPERATOR' and self.parser.current_token()[1] == '=':
-                self.parser.match('ARITHMETIC_OPERATOR')
-                initializer = self.parser.expression_parser.parse_expression()
-                self.parser.match('SEMICOLON')
+        parser = self.parser
+        values = parser.values
+        if values[parser.position] in _TYPE_KEYWORDS:
+            var_type = self.match(KEYWORD)
+            var_name = self.match(IDENTIFIER)
+            if self._type_at(0) is ARITHMETIC_OPERATOR and values[parser.position] == '=':
+                self.match(ARITHMETIC_OPERATOR)
+                initializer = self.parse_expression()
+                self.match(SEMICOLON)
                 return {'type': 'VARIABLE_DECLARATION', 'var_type': var_type, 'var_name': var_name, 'initializer': initializer}
             else:
-                self.parser.match('SEMICOLON')
+                self.match(SEMICOLON)
                 return {'type': 'VARIABLE_DECLARATION', 'var_type': var_type, 'var_name': var_name}
         else:
-            raise SyntaxError(f"Unsupported type: {self.parser.current_token()[1]}")
+            raise SyntaxError(f"Unsupported type: {values[parser.position]}")
 
     def parse_function_call(self):
-        func_name = self.parser.match('IDENTIFIER')[1]
-        self.parser.match('LPAREN')
+        func_name = self.match(IDENTIFIER)
+        self.match(LPAREN)
         args = []
-        if self.parser.current_token()[0] != 'RPAREN':
-            args.append(self.parser.expression_parser.parse_expression())
-            while self.parser.current_token() and self.parser.current_token()[0] == 'COMMA':
-                self.parser.match('COMMA')
-                args.append(self.parser.expression_parser.parse_expression())
-        self.parser.match('RPAREN')
-        self.parser.match('SEMICOLON')
+        if self._type_at(0) is not RPAREN:
+            args.append(self.parse_expression())
+            while self._type_at(0) is COMMA:
+                self.match(COMMA)
+                args.append(self.parse_expression())
+        self.match(RPAREN)
+        self.match(SEMICOLON)
         return {'type': 'FUNCTION_CALL', 'func_name': func_name, 'args': args}
 
 
 class ExpressionParser:
     def __init__(self, parser):
         self.parser = parser
+        self.match = parser.match  # Bound once for the hot term/expression loop
 
     def parse_expression(self):
+        return self.parse_binary(0)
+
+    # Precedence climbing: keep folding operators that bind tighter than min_power into the left operand
+    def parse_binary(self, min_power):
+        parser = self.parser
+        values = parser.values
         left = self.parse_term()
-        while self.parser.current_token() and self.parser.current_token()[0] in ['ARITHMETIC_OPERATOR', 'RELATIONAL_OPERATOR']:
-            operator = self.parser.match(self.parser.current_token()[0])[1]
-            right = self.parse_term()
+        power = _BINDING_POWER.get(values[parser.position], 0)
+        while power > min_power:
+            operator = values[parser.position]
+            parser.position += 1
+            right = self.parse_binary(power - 1 if operator in _RIGHT_ASSOCIATIVE else power)
             left = {'type': 'BINARY_EXPRESSION', 'operator': operator, 'left': left, 'right': right}
+            power = _BINDING_POWER.get(values[parser.position], 0)
         return left
 
     def parse_term(self):
-        token = self.parser.current_token()
-        if token[0] == 'NUMBER':
-            return {'type': 'NUMBER', 'value': self.parser.match('NUMBER')[1]}
-        elif token[0] == 'IDENTIFIER':
-            node = {'type': 'IDENTIFIER', 'value': self.parser.match('IDENTIFIER')[1]}
-            if self.parser.current_token() and self.parser.current_token()[0] == 'ARITHMETIC_OPERATOR' and self.parser.current_token()[1] in ['++', '--']:
-                operator = self.parser.match('ARITHMETIC_OPERATOR')[1]
-                return {'type': 'INCREMENT', 'var_name': node['value'], 'operator': operator}
-            return node
-        elif token[0] == 'STRING':
-            return {'type': 'STRING_LITERAL', 'value': self.parser.match('STRING')[1]}
-        elif token[0] == 'LPAREN':
-            self.parser.match('LPAREN')
+        # Leaf terms consume their token inline; position is written back once per term
+        parser = self.parser
+        types = parser.types
+        values = parser.values
+        position = parser.position
+        token_type = types[position]
+        if token_type is NUMBER:
+            parser.position = position + 1
+            return {'type': 'NUMBER', 'value': values[position]}
+        elif token_type is IDENTIFIER:
+            name = values[position]
+            if types[position + 1] is ARITHMETIC_OPERATOR and values[position + 1] in _INCDEC:
+                parser.position = position + 2
+                return {'type': 'INCREMENT', 'var_name': name, 'operator': values[position + 1]}
+            parser.position = position + 1
+            return {'type': 'IDENTIFIER', 'value': name}
+        elif token_type is STRING:
+            parser.position = position + 1
+            value = values[position]
+            # Shape flags let code generation skip re-scanning the literal
+            return {'type': 'STRING_LITERAL', 'value': value, 'has_newline': '\\n' in value, 'raw_no_quotes': value[1:-1]}
+        elif token_type is LPAREN:
+            self.match(LPAREN)
             expression = self.parse_expression()
-            self.parser.match('RPAREN')
+            self.match(RPAREN)
             return expression
         else:
-            if token[0] in ['SEMICOLON', 'LBRACE', 'RBRACE']:
+            token = (token_type, values[position])
+            if token_type in _EXPRESSION_END_TYPES:
                 raise SyntaxError(f"Unexpected end of expression: {token}")
-            raise SyntaxError(f"Unexpected token in expression: {token}")
\ No newline at end of file
+            raise SyntaxError(f"Unexpected token in expression: {token}")
+
+
+# Parse a C++ file repeatedly and report the mean time; the repeats also warm up a tracing JIT such as PyPy's
+if __name__ == "__main__":
+    import time
+    from lexercpp import Lexer
+
+    if len(sys.argv) < 2:
+        print("Usage: python parsercpp.py <file.cpp> [repeats]")
+        sys.exit(1)
+    with open(sys.argv[1], 'r') as file:
+        tokens = Lexer().tokenize(file.read())
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    start = time.perf_counter()
+    for _ in range(repeats):
+        Parser(tokens).parse_program()
+    print(f"Parsed {len(tokens)} tokens {repeats} times: {(time.perf_counter() - start) / repeats * 1000:.3f} ms per parse")
\ No newline at end of file
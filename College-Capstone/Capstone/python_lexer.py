@@ -2,45 +2,56 @@ import re
 
 # Define token types with regex patterns
 TOKEN_TYPES = [
-    ('STRING', r"(?<!\\)('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")"),# String literals with single or double quotes
+    ('STRING', r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\""),# String literals with single or double quotes
     ('KEYWORD', r'\b(?:print|input|while|for|if|elif|else)\b'),# Python keywords
     ('IDENTIFIER', r'[a-zA-Z_][a-zA-Z0-9_]*'),        # Variable/function names
     ('COMPARISON_OPERATOR', r'[<>]=?|==|!=|>=|<='),   # Comparison operators
     ('ARITHMETIC_OPERATOR', r'[+\-*/%]'),             # Arithmetic operators
     ('ASSIGNMENT_OPERATOR', r'='),                    # Assignment operator
     ('LOGICAL_OPERATOR', r'&&|\|\|'),           # Logical operators (C++ style)
-    ('BITWISE_OPERATOR', r'&|\||~|^'),                # Bitwise operators
+    ('BITWISE_OPERATOR', r'&|\||~|\^'),               # Bitwise operators
     ('LPAREN', r'\('),                                # Left parenthesis
     ('RPAREN', r'\)'),                                # Right parenthesis
-    ('WHITESPACE', r'\s+'),                         # Whitespace (ignored)
     ('COLON', r':'),                                # Colon for Python blocks
-    ('NUMBER', r'\d+(\.\d*)?'),                      # Integer or float numbers
+    ('NUMBER', r'\d+(?:\.\d*)?'),                    # Integer or float numbers
     ('COMMA', r','),                            # Comma for argument separation
 ]
 
-# Lexer class to tokenize Python-like source code
+_ASCII_WHITESPACE = ' \t\n\r\f\v'  # What \s matches under re.ASCII
+
+# Token patterns compiled once at import and shared by every tokenize call.
+# Leading whitespace is consumed by the match itself, so it never becomes a match or a token
+_COMPILED_TOKEN_TYPES = [(name, re.compile(pattern, re.ASCII)) for name, pattern in TOKEN_TYPES]
+_MASTER_PATTERN = re.compile(r'\s*(?:' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in TOKEN_TYPES) + ')', re.ASCII)
+
+# Convert source string into a list of (type, value) tokens
+def tokenize(source):
+    position = 0  # Current position in source string
+    tokens = []   # List to store token tuples (type, value)
+    append = tokens.append  # Bound once; list growth is amortized, so no preallocation
+    # Single alternation of every pattern; alternatives are tried in TOKEN_TYPES order
+    for match in _MASTER_PATTERN.finditer(source):
+        if match.start() != position:
+            break  # Skipped over characters no token type matches
+        name = match.lastgroup
+        # Add token type and matched string (without the skipped whitespace) to list
+        append((name, match[name]))
+        position = match.end()  # Move position to end of match
+    # Whitespace is only consumed ahead of a token, so trailing whitespace is skipped here
+    rest = source[position:].lstrip(_ASCII_WHITESPACE)
+    if rest:
+        position = len(source) - len(rest)
+        # Debug info and error if no token matches
+        print(f"No match found at position {position}, text: {source[position:position+10]}")
+        raise ValueError(f"Unable to tokenize at position {position}")
+    return tokens  # Return list of tokens
+
+# Lexer class kept for existing callers; it holds no state of its own
 class PythonLexer:
     def __init__(self):
-        # Compile regex patterns for each token type
-        self.token_types = [(name, re.compile(pattern)) for name, pattern in TOKEN_TYPES]
+        self.token_types = _COMPILED_TOKEN_TYPES
+        self.master_pattern = _MASTER_PATTERN
 
     # Convert source string into a list of tokens
     def tokenize(self, source):
-        position = 0  # Current position in source string
-        tokens = []   # List to store token tuples (type, value)
-        while position < len(source):
-            match = None
-            # Try matching each token type at current position
-            for name, pattern in self.token_types:
-                match = pattern.match(source, position)
-                if match:
-                    if name != 'WHITESPACE':  # Skip whitespace tokens
-                        # Add token type and matched string to list
-                        tokens.append((name, match.group(0)))
-                    position = match.end()  # Move position to end of match
-                    break
-            if not match:
-                # Debug info and error if no token matches
-                print(f"No match found at position {position}, text: {source[position:position+10]}")
-                raise ValueError(f"Unable to tokenize at position {position}")
-        return tokens  # Return list of tokens
\ No newline at end of file
+        return tokenize(source)
\ No newline at end of file
@@ -1,300 +1,311 @@
-import re
+import sys
+from ast_nodes import (Program, FunctionDef, ForLoop, WhileLoop, VarDecl, Assignment, IfStmt, IoStmt,
+                       PrintStmt, Block, FuncCall, BinaryExpr, Number, StringLit, Identifier)
+
+# Token type tags, interned so the parser can compare them by identity
+KEYWORD = sys.intern('KEYWORD')
+IDENTIFIER = sys.intern('IDENTIFIER')
+NUMBER = sys.intern('NUMBER')
+STRING = sys.intern('STRING')
+LPAREN = sys.intern('LPAREN')
+RPAREN = sys.intern('RPAREN')
+LBRACE = sys.intern('LBRACE')
+RBRACE = sys.intern('RBRACE')
+COMMA = sys.intern('COMMA')
+COLON = sys.intern('COLON')
+SEMICOLON = sys.intern('SEMICOLON')
+ASSIGNMENT_OPERATOR = sys.intern('ASSIGNMENT_OPERATOR')
+ARITHMETIC_OPERATOR = sys.intern('ARITHMETIC_OPERATOR')
+RELATIONAL_OPERATOR = sys.intern('RELATIONAL_OPERATOR')
+COMPARISON_OPERATOR = sys.intern('COMPARISON_OPERATOR')
+INSERTION_OPERATOR = sys.intern('INSERTION_OPERATOR')
+EOF = sys.intern('EOF')  # Type of the sentinel token that ends every token list
+
+# Token sets tested with membership during parsing
+_TYPE_KEYWORDS = frozenset(('int', 'float', 'void'))
+_BRANCH_KEYWORDS = frozenset(('elif', 'else'))
+_LOOP_KEYWORDS = frozenset(('while', 'for'))
+_IO_STREAMS = frozenset(('cout', 'cin'))
+_BINARY_OPERATORS = frozenset((ARITHMETIC_OPERATOR, RELATIONAL_OPERATOR, COMPARISON_OPERATOR))
+_NAME_TYPES = frozenset((IDENTIFIER, KEYWORD))
+_BLOCK_END_TYPES = frozenset((RBRACE, EOF))
+_ARGUMENTS_END_TYPES = frozenset((RPAREN, EOF))
 
 # Main parser class to convert token stream into an AST
 class PythonParser:
     def __init__(self, tokens):
-        self.tokens = tokens  # List of token tuples (type, value)
+        # Token types and values in parallel lists, ending in an EOF sentinel so lookahead never runs off
+        # the end. Types and keyword values are interned so they can be compared by identity
+        self.types = []
+        self.values = []
+        for token_type, token_value in tokens:
+            token_type = sys.intern(token_type)
+            self.types.append(token_type)
+            self.values.append(sys.intern(token_value) if token_type is KEYWORD else token_value)
+        self.types.append(EOF)
+        self.values.append(None)
         self.position = 0     # Current position in token stream
         self.statement_parser = StatementParser(self)  # Helper for statements
         self.expression_parser = ExpressionParser(self)  # Helper for expressions
 
     # Get current token or None if at end
     def current_token(self):
-        return self.tokens[self.position] if self.position < len(self.tokens) else None
+        position = self.position
+        token_type = self.types[position]
+        return (token_type, self.values[position]) if token_type is not EOF else None
 
-    # Match and consume expected token type, raise error if mismatch
+    # Match and consume expected token type and return its value, raise error if mismatch
     def match(self, expected_type):
-        token = self.current_token()
-        if token and token[0] == expected_type:
-            self.position += 1
-            return token
+        position = self.position
+        if self.types[position] is expected_type:
+            self.position = position + 1
+            return self.values[position]
         else:
-            raise ValueError(f"Expected {expected_type} but got {token}")
-
-    # Check if current tokens indicate a function definition
-    def is_function_definition(self):
-        if (
-            self.current_token()
-            and self.current_token()[0] == 'KEYWORD'
-            and self.current_token()[1] in ['int', 'float', 'void']
-        ):
-            next_token = self.tokens[self.position + 1] if self.position + 1 < len(self.tokens) else None
-            if next_token and next_token[0] == 'IDENTIFIER':
-                next_next_token = self.tokens[self.position + 2] if self.position + 2 < len(self.tokens) else None
-                if next_next_token and next_next_token[0] == 'LPAREN':
-                    return True
-        return False
+            raise ValueError(f"Expected {expected_type} but got {self.current_token()}")
 
     # Parse entire token stream into a PROGRAM AST node
     def parse_program(self):
         statements = []
-        while self.current_token():
-            if self.is_function_definition():
-                statements.append(self.statement_parser.parse_function_definition())
-            else:
-                statements.append(self.statement_parser.parse_statement())
-        return {'type': 'PROGRAM', 'statements': statements}
+        append = statements.append  # Bound once; the loop runs once per top-level statement
+        types = self.types
+        # Function definitions are recognized by parse_statement's type-keyword handler, which
+        # peeks at the two tokens after the type once
+        parse_statement = self.statement_parser.parse_statement
+        while types[self.position] is not EOF:
+            append(parse_statement())
+        return Program(statements)
 
 # Helper class to parse statements
 class StatementParser:
     def __init__(self, parser):
         self.parser = parser  # Reference to main parser
+        # Statement parsers keyed on their leading keyword
+        self._kw_dispatch = {
+            'print': self.parse_print_statement,
+            'if': self.parse_if_statement,
+            'while': self.parse_while_loop,
+            'return': self.parse_return_statement,
+            'for': self.parse_for_loop,
+        }
+        self._kw_dispatch.update(dict.fromkeys(_TYPE_KEYWORDS, self._parse_typed))
 
     # Parse a single statement based on current token
     def parse_statement(self):
-        token = self.parser.current_token()
-        if not token:
+        types = self.parser.types
+        position = self.parser.position
+        token_type = types[position]
+        token_value = self.parser.values[position]
+        if token_type is EOF:
             raise SyntaxError("Unexpected end of input while parsing statement")
-        token_type, token_value = token
-        if token_type == 'KEYWORD':
-            if token_value == 'print':
-                return self.parse_print_statement()
-            elif token_value == 'if':
-                return self.parse_if_statement()
-            elif token_value == 'while':
-                return self.parse_while_loop()
-            elif token_value == 'return':
-                return self.parse_return_statement()
-            elif token_value == 'for':
-                return self.parse_for_loop()
-            elif token_value in ['int', 'float', 'void']:
-                next_token = self.parser.tokens[self.parser.position + 1] if self.parser.position + 1 < len(self.parser.tokens) else None
-                if next_token and next_token[0] == 'IDENTIFIER':
-                    next_next_token = self.parser.tokens[self.parser.position + 2] if self.parser.position + 2 < len(self.parser.tokens) else None
-                    if next_next_token and next_next_token[0] == 'LPAREN':
-                        return self.parse_function_definition()
-                    else:
-                        return self.parse_variable_declaration()
-                else:
-                    raise SyntaxError(f"Unexpected token after type: {token_value}")
-            elif token_value in ['elif', 'else']:
+        if token_type is KEYWORD:
+            handler = self._kw_dispatch.get(token_value)
+            if handler is not None:
+                return handler()
+            elif token_value in _BRANCH_KEYWORDS:
                 raise SyntaxError(f"'{token_value}' encountered outside of if statement context")
             else:
                 raise SyntaxError(f"Unsupported keyword: {token_value}")
-        elif token_type == 'IDENTIFIER':
-            next_token = self.parser.tokens[self.parser.position + 1] if self.parser.position + 1 < len(self.parser.tokens) else None
-            if next_token and next_token[0] == 'LPAREN':
+        elif token_type is IDENTIFIER:
+            next_type = types[position + 1]
+            if next_type is LPAREN:
                 return self.parse_function_call()
-            elif next_token and (next_token[0] == 'ASSIGNMENT_OPERATOR' or 
-                                (next_token[0] == 'ARITHMETIC_OPERATOR' and 
-                                self.parser.tokens[self.parser.position + 2][0] == 'ASSIGNMENT_OPERATOR' if self.parser.position + 2 < len(self.parser.tokens) else False)):
+            elif next_type is ASSIGNMENT_OPERATOR or (next_type is ARITHMETIC_OPERATOR and
+                                                        types[position + 2] is ASSIGNMENT_OPERATOR):
                 return self.parse_assignment()
-            elif token_value in ['cout', 'cin']:
+            elif token_value in _IO_STREAMS:
                 return self.parse_io_statement()
             else:
                 raise SyntaxError(f"Unexpected identifier usage: {token_value}")
-        elif token_type == 'LBRACE':
+        elif token_type is LBRACE:
             return self.parse_block()
         else:
             raise SyntaxError(f"Unexpected token: {token_type} {token_value}")
 
+    # Parse a function definition or variable declaration starting with a type keyword
+    def _parse_typed(self):
+        parser = self.parser
+        types = parser.types
+        position = parser.position
+        if types[position + 1] is IDENTIFIER:
+            if types[position + 2] is LPAREN:
+                return self.parse_function_definition()
+            else:
+                return self.parse_variable_declaration()
+        else:
+            raise SyntaxError(f"Unexpected token after type: {parser.values[position]}")
+
     # Parse function definition (e.g., int foo())
     def parse_function_definition(self):
-        return_type = self.parser.match('KEYWORD')[1]  # e.g., 'int'
-        func_name = self.parser.match('IDENTIFIER')[1]  # Function name
-        self.parser.match('LPAREN')
-        self.parser.match('RPAREN')  # No parameters supported yet
+        parser = self.parser
+        return_type = parser.match(KEYWORD)  # e.g., 'int'
+        func_name = parser.match(IDENTIFIER)  # Function name
+        parser.match(LPAREN)
+        parser.match(RPAREN)  # No parameters supported yet
         body = self.parse_block()
-        return {
-            'type': 'FUNCTION_DEFINITION',
-            'return_type': return_type,
-            'func_name': func_name,
-            'body': body['statements'],
-        }
+        return FunctionDef(return_type, func_name, body.statements)
 
     # Parse for loop (e.g., for i in range(...))
     def parse_for_loop(self):
-        self.parser.match('KEYWORD')  # 'for'
-        iterator = self.parser.match('IDENTIFIER')[1]  # Loop variable
-        self.parser.match('IDENTIFIER')  # 'in'
-        range_token = self.parser.match('IDENTIFIER')
-        if range_token[1] != 'range':
+        parser = self.parser
+        parser.match(KEYWORD)  # 'for'
+        iterator = parser.match(IDENTIFIER)  # Loop variable
+        parser.match(IDENTIFIER)  # 'in'
+        if parser.match(IDENTIFIER) != 'range':
             raise SyntaxError("Expected 'range' after 'in' in for loop")
-        self.parser.match('LPAREN')
-        start = self.parser.expression_parser.parse_expression()  # First range arg
+        parser.match(LPAREN)
+        types = parser.types
+        parse_expression = parser.expression_parser.parse_expression
+        start = parse_expression()  # First range arg
         stop = None
         step = None
-        if self.parser.current_token() and self.parser.current_token()[0] == 'COMMA':
-            self.parser.match('COMMA')
-            stop = self.parser.expression_parser.parse_expression()  # Second range arg
-            if self.parser.current_token() and self.parser.current_token()[0] == 'COMMA':
-                self.parser.match('COMMA')
-                step = self.parser.expression_parser.parse_expression()  # Third range arg
-        self.parser.match('RPAREN')
-        self.parser.match('COLON')
+        if types[parser.position] is COMMA:
+            parser.position += 1
+            stop = parse_expression()  # Second range arg
+            if types[parser.position] is COMMA:
+                parser.position += 1
+                step = parse_expression()  # Third range arg
+        parser.match(RPAREN)
+        parser.match(COLON)
         body = [self.parse_statement()]  # Single statement body
         if stop is None:
-            return {'type': 'FOR_LOOP', 'iterator': iterator, 'limit': start, 'body': body}
-        elif step is None:
-            return {'type': 'FOR_LOOP', 'iterator': iterator, 'start': start, 'stop': stop, 'body': body}
+            return ForLoop(iterator, body, limit=start)
         else:
-            return {'type': 'FOR_LOOP', 'iterator': iterator, 'start': start, 'stop': stop, 'step': step, 'body': body}
+            return ForLoop(iterator, body, start=start, stop=stop, step=step)
 
     # Parse while loop
     def parse_while_loop(self):
-        self.parser.match('KEYWORD')  # 'while'
-        condition = self.parser.expression_parser.parse_expression()
-        self.parser.match('COLON')    # Expect ':'
+        parser = self.parser
+        parser.match(KEYWORD)  # 'while'
+        condition = parser.expression_parser.parse_expression()
+        parser.match(COLON)    # Expect ':'
         body = []
-        while self.parser.current_token() and self.parser.current_token()[1] not in ['while', 'for']:
+        types = parser.types
+        values = parser.values
+        while types[parser.position] is not EOF and values[parser.position] not in _LOOP_KEYWORDS:
             body.append(self.parse_statement())
-        return {'type': 'WHILE_LOOP', 'condition': condition, 'body': body}
+        return WhileLoop(condition, body)
 
     # Parse variable declaration (e.g., int x = 5)
     def parse_variable_declaration(self):
-        var_type = self.parser.match('KEYWORD')[1]  # e.g., 'int'
-        var_name = self.parser.match('IDENTIFIER')[1]
-        if self.parser.current_token() and self.parser.current_token()[0] == 'ASSIGNMENT_OPERATOR':
-            self.parser.match('ASSIGNMENT_OPERATOR')
-            initializer = self.parser.expression_parser.parse_expression()
-            if self.parser.current_token() and self.parser.current_token()[0] == 'SEMICOLON':
-                self.parser.match('SEMICOLON')
-            return {'type': 'VARIABLE_DECLARATION', 'var_type': var_type, 'var_name': var_name, 'initializer': initializer}
+        parser = self.parser
+        var_type = parser.match(KEYWORD)  # e.g., 'int'
+        var_name = parser.match(IDENTIFIER)
+        types = parser.types
+        if types[parser.position] is ASSIGNMENT_OPERATOR:
+            parser.position += 1
+            initializer = parser.expression_parser.parse_expression()
+            if types[parser.position] is SEMICOLON:
+                parser.position += 1
+            return VarDecl(var_type, var_name, initializer)
         else:
-            if self.parser.current_token() and self.parser.current_token()[0] == 'SEMICOLON':
-                self.parser.match('SEMICOLON')
-            return {'type': 'VARIABLE_DECLARATION', 'var_type': var_type, 'var_name': var_name}
+            if types[parser.position] is SEMICOLON:
+                parser.position += 1
+            return VarDecl(var_type, var_name)
 
     # Parse assignment (e.g., x = 5 or x += 1)
     def parse_assignment(self):
-        var_name = self.parser.match('IDENTIFIER')[1]
-        next_token = self.parser.current_token()
-        if next_token[0] == 'ASSIGNMENT_OPERATOR':
-            self.parser.match('ASSIGNMENT_OPERATOR')
-            expression = self.parser.expression_parser.parse_expression()
-        elif next_token[0] == 'ARITHMETIC_OPERATOR':
-            operator = self.parser.match('ARITHMETIC_OPERATOR')[1]
-            self.parser.match('ASSIGNMENT_OPERATOR')
-            right = self.parser.expression_parser.parse_expression()
-            expression = {
-                'type': 'BINARY_EXPRESSION',
-                'operator': operator,
-                'left': {'type': 'IDENTIFIER', 'value': var_name},
-                'right': right
-            }
+        parser = self.parser
+        types = parser.types
+        var_name = parser.match(IDENTIFIER)
+        next_type = types[parser.position]
+        if next_type is ASSIGNMENT_OPERATOR:
+            parser.match(ASSIGNMENT_OPERATOR)
+            expression = parser.expression_parser.parse_expression()
+        elif next_type is ARITHMETIC_OPERATOR:
+            operator = parser.match(ARITHMETIC_OPERATOR)
+            parser.match(ASSIGNMENT_OPERATOR)
+            right = parser.expression_parser.parse_expression()
+            expression = BinaryExpr(operator, Identifier(var_name), right)
         else:
             raise SyntaxError(f"Expected assignment operator after {var_name}")
-        if self.parser.current_token() and self.parser.current_token()[0] == 'SEMICOLON':
-            self.parser.match('SEMICOLON')
-        return {'type': 'ASSIGNMENT', 'var_name': var_name, 'expression': expression}
+        if types[parser.position] is SEMICOLON:
+            parser.position += 1
+        return Assignment(var_name, expression)
 
     # Parse function call (e.g., foo())
     def parse_function_call(self):
-        func_name = self.parser.match('IDENTIFIER')[1]
-        self.parser.match('LPAREN')
-        args = self.parse_arguments()
-        self.parser.match('RPAREN')
-        if self.parser.current_token() and self.parser.current_token()[0] == 'SEMICOLON':
-            self.parser.match('SEMICOLON')
-        return {'type': 'FUNCTION_CALL', 'func_name': func_name, 'args': args}
+        parser = self.parser
+        func_name = parser.match(IDENTIFIER)
+        parser.match(LPAREN)
+        args = parser.expression_parser.parse_arguments()
+        parser.match(RPAREN)
+        if parser.types[parser.position] is SEMICOLON:
+            parser.position += 1
+        return FuncCall(func_name, args)
 
     # Parse comma-separated arguments
     def parse_arguments(self):
-        args = []
-        while self.parser.current_token() and self.parser.current_token()[0] != 'RPAREN':
-            args.append(self.parser.expression_parser.parse_expression())
-            if self.parser.current_token() and self.parser.current_token()[0] == 'COMMA':
-                self.parser.match('COMMA')
-        return args
+        return self.parser.expression_parser.parse_arguments()
 
     # Parse if statement with optional elif/else
     def parse_if_statement(self):
-        self.parser.match('KEYWORD')  # 'if'
-        condition = self.parser.expression_parser.parse_expression()
-        self.parser.match('COLON')    # Expect ':'
+        parser = self.parser
+        expression_parser = parser.expression_parser
+        parser.match(KEYWORD)  # 'if'
+        condition = expression_parser.parse_expression()
+        parser.match(COLON)    # Expect ':'
+        types = parser.types
+        values = parser.values
         true_body = []
-        if self.parser.current_token():
+        if types[parser.position] is not EOF:
             true_body.append(self.parse_statement())  # Single statement for true branch
-        true_branch = {'type': 'BLOCK', 'statements': true_body}
-        false_branch = None
-        current_node = None
+        # The if node heads the elif/else chain; each branch is linked onto the current tail
+        if_node = tail = IfStmt(condition, Block(true_body), None)
 
-        while self.parser.current_token() and self.parser.current_token()[1] in ['elif', 'else']:
-            if self.parser.current_token()[1] == 'elif':
-                self.parser.match('KEYWORD')  # 'elif'
-                elif_condition = self.parser.expression_parser.parse_expression()
-                self.parser.match('COLON')
+        keyword = values[parser.position]
+        while keyword in _BRANCH_KEYWORDS:
+            if keyword == 'elif':
+                parser.match(KEYWORD)  # 'elif'
+                elif_condition = expression_parser.parse_expression()
+                parser.match(COLON)
                 elif_body = []
-                if self.parser.current_token():
+                if types[parser.position] is not EOF:
                     elif_body.append(self.parse_statement())  # Single statement for elif
-                elif_true_branch = {'type': 'BLOCK', 'statements': elif_body}
-                elif_node = {
-                    'type': 'IF_STATEMENT',
-                    'condition': elif_condition,
-                    'true_branch': elif_true_branch,
-                    'false_branch': None
-                }
-                if not false_branch:
-                    false_branch = elif_node
-                    current_node = elif_node
-                else:
-                    current_node['false_branch'] = elif_node
-                    current_node = elif_node
-            elif self.parser.current_token()[1] == 'else':
-                self.parser.match('KEYWORD')  # 'else'
-                self.parser.match('COLON')
+                elif_node = IfStmt(elif_condition, Block(elif_body), None)
+                tail.false_branch = elif_node
+                tail = elif_node
+                keyword = values[parser.position]
+            elif keyword == 'else':
+                parser.match(KEYWORD)  # 'else'
+                parser.match(COLON)
                 else_body = []
-                if self.parser.current_token():
+                if types[parser.position] is not EOF:
                     else_body.append(self.parse_statement())  # Single statement for else
-                else_block = {'type': 'BLOCK', 'statements': else_body}
-                if not false_branch:
-                    false_branch = else_block
-                else:
-                    current_node['false_branch'] = else_block
+                tail.false_branch = Block(else_body)
                 break
-        return {
-            'type': 'IF_STATEMENT',
-            'condition': condition,
-            'true_branch': true_branch,
-            'false_branch': false_branch
-        }
+        return if_node
 
     # Parse C++-style I/O (e.g., cout << x)
     def parse_io_statement(self):
-        io_operator = self.parser.match('IDENTIFIER')[1]  # 'cout' or 'cin'
-        operator_token = self.parser.current_token()
-        if operator_token and operator_token[0] == 'INSERTION_OPERATOR':
-            self.parser.match('INSERTION_OPERATOR')
-            expression = self.parser.expression_parser.parse_expression()
-            self.parser.match('SEMICOLON')
-            return {
-                'type': 'IO_STATEMENT',
-                'io_operator': io_operator,
-                'expression': expression
-            }
+        parser = self.parser
+        io_operator = parser.match(IDENTIFIER)  # 'cout' or 'cin'
+        if parser.types[parser.position] is INSERTION_OPERATOR:
+            parser.match(INSERTION_OPERATOR)
+            expression = parser.expression_parser.parse_expression()
+            parser.match(SEMICOLON)
+            return IoStmt(io_operator, expression)
         else:
             raise SyntaxError(f"Expected insertion operator after {io_operator}")
 
     # Parse print statement
     def parse_print_statement(self):
-        self.parser.match('KEYWORD')  # 'print'
-        self.parser.match('LPAREN')
-        args = []
-        while self.parser.current_token() and self.parser.current_token()[0] != 'RPAREN':
-            args.append(self.parser.expression_parser.parse_expression())
-            if self.parser.current_token() and self.parser.current_token()[0] == 'COMMA':
-                self.parser.match('COMMA')
-        self.parser.match('RPAREN')
-        return {'type': 'PRINT_STATEMENT', 'args': args}
+        parser = self.parser
+        parser.match(KEYWORD)  # 'print'
+        parser.match(LPAREN)
+        args = parser.expression_parser.parse_arguments()
+        parser.match(RPAREN)
+        return PrintStmt(args)
 
     # Parse block (e.g., { ... })
     def parse_block(self):
-        self.parser.match('LBRACE')
+        parser = self.parser
+        parser.match(LBRACE)
         statements = []
-        while self.parser.current_token() and self.parser.current_token()[0] != 'RBRACE':
+        types = parser.types
+        while types[parser.position] not in _BLOCK_END_TYPES:
             statements.append(self.parse_statement())
-        self.parser.match('RBRACE')
-        return {'type': 'BLOCK', 'statements': statements}
+        parser.match(RBRACE)
+        return Block(statements)
 
     # Placeholder for return statement (not implemented)
     def parse_return_statement(self):
@@ -307,47 +318,58 @@ class ExpressionParser:
 
     # Parse expressions with binary operators
     def parse_expression(self):
+        parser = self.parser
+        types = parser.types
         left = self.parse_term()
-        while self.parser.current_token() and self.parser.current_token()[0] in ['ARITHMETIC_OPERATOR', 'RELATIONAL_OPERATOR', 'COMPARISON_OPERATOR']:
-            operator = self.parser.match(self.parser.current_token()[0])[1]
+        while types[parser.position] in _BINARY_OPERATORS:
+            operator = parser.values[parser.position]
+            parser.position += 1
             right = self.parse_term()
-            left = {'type': 'BINARY_EXPRESSION', 'operator': operator, 'left': left, 'right': right}
+            left = BinaryExpr(operator, left, right)
         return left
 
     # Parse basic terms (numbers, strings, identifiers, function calls)
     def parse_term(self):
-        token = self.parser.current_token()
-        if not token:
+        parser = self.parser
+        types = parser.types
+        position = parser.position
+        token_type = types[position]
+        token_value = parser.values[position]
+        if token_type is EOF:
             raise SyntaxError("Unexpected end of input in expression")
-        if token[0] == 'NUMBER':
-            return {'type': 'NUMBER', 'value': self.parser.match('NUMBER')[1]}
-        elif token[0] == 'STRING':
-            return {'type': 'STRING_LITERAL', 'value': self.parser.match('STRING')[1]}
-        elif token[0] in ['IDENTIFIER', 'KEYWORD']:
-            token_type, token_value = token
-            self.parser.match(token_type)
-            if self.parser.current_token() and self.parser.current_token()[0] == 'LPAREN':
-                self.parser.match('LPAREN')
+        # Leaf tokens are consumed inline rather than through parser.match()
+        if token_type is NUMBER:
+            parser.position = position + 1
+            return Number(token_value)
+        elif token_type is STRING:
+            parser.position = position + 1
+            return StringLit(token_value)
+        elif token_type in _NAME_TYPES:
+            parser.position = position + 1
+            if types[position + 1] is LPAREN:
+                parser.position = position + 2
                 args = self.parse_arguments()
-                self.parser.match('RPAREN')
-                return {'type': 'FUNCTION_CALL', 'func_name': token_value, 'args': args}
-            if token_type == 'IDENTIFIER':
-                return {'type': 'IDENTIFIER', 'value': token_value}
+                parser.match(RPAREN)
+                return FuncCall(token_value, args)
+            if token_type is IDENTIFIER:
+                return Identifier(token_value)
             else:
                 raise SyntaxError(f"Keyword '{token_value}' used outside of function call")
-        elif token[0] == 'LPAREN':
-            self.parser.match('LPAREN')
+        elif token_type is LPAREN:
+            parser.position = position + 1
             expression = self.parse_expression()
-            self.parser.match('RPAREN')
+            parser.match(RPAREN)
             return expression
         else:
-            raise SyntaxError(f"Unexpected token in expression: {token}")
+            raise SyntaxError(f"Unexpected token in expression: {(token_type, token_value)}")
 
     # Parse comma-separated arguments for function calls
     def parse_arguments(self):
+        parser = self.parser
+        types = parser.types
         args = []
-        while self.parser.current_token() and self.parser.current_token()[0] != 'RPAREN':
+        while types[parser.position] not in _ARGUMENTS_END_TYPES:
             args.append(self.parse_expression())
-            if self.parser.current_token() and self.parser.current_token()[0] == 'COMMA':
-                self.parser.match('COMMA')
+            if types[parser.position] is COMMA:
+                parser.position += 1
         return args
\ No newline at end of file
@@ -1,96 +1,132 @@
+from ast_nodes import (ForLoop, WhileLoop, VarDecl, Assignment, IfStmt, IoStmt, ReturnStmt, PrintStmt, Block,
+                       FuncCall, BinaryExpr, Number, StringLit, Identifier)
+
+# Node classes accepted as a print argument, loop or if condition, or variable initializer
+_EXPRESSION_NODES = frozenset((StringLit, Identifier, BinaryExpr, Number, FuncCall))
+# Functions whose result may be assigned
+_ASSIGNABLE_CALLS = frozenset(('input', 'int'))
+
 class PythonSemanticAnalyzer:
-    # Analyzes the AST and returns a list of semantic errors
+    def __init__(self):
+        # Statement checks keyed on node class
+        self._dispatch = {
+            PrintStmt: self._analyze_print,
+            Assignment: self._analyze_assignment,
+            ForLoop: self._analyze_for,
+            WhileLoop: self._analyze_while,
+            IfStmt: self._analyze_if,
+            FuncCall: self._analyze_function_call,
+            ReturnStmt: self._analyze_return,
+            VarDecl: self._analyze_variable_declaration,
+            IoStmt: self._analyze_io,
+            Block: self._analyze_block,
+        }
+
+    # Analyzes the AST and returns a list of semantic errors. Nested statements are pushed onto a work
+    # stack in reverse rather than analyzed recursively, so they are still checked in source order
     def analyze(self, ast):
         errors = []
-        for statement in ast['statements']:
-            if statement['type'] == 'PRINT_STATEMENT':
-                if 'args' not in statement or not statement['args']:
-                    errors.append("Print statement must have at least one argument to print.")
-                else:
-                    for arg in statement['args']:
-                        if arg['type'] not in ['STRING_LITERAL', 'IDENTIFIER', 'BINARY_EXPRESSION', 'NUMBER', 'FUNCTION_CALL']:
-                            errors.append(f"Print statement only supports string literals, identifiers, binary expressions, numbers, or function calls. Found: {arg['type']}")
-            elif statement['type'] == 'ASSIGNMENT':
-                if 'expression' not in statement:
-                    errors.append(f"Assignment for variable '{statement['var_name']}' must have an expression.")
-                else:
-                    if not isinstance(statement['var_name'], str) or not statement['var_name']:
-                        errors.append(f"Assignment must have a valid variable name, got: {statement['var_name']}")
-                    expr = statement['expression']
-                    if expr['type'] == 'FUNCTION_CALL' and expr['func_name'] not in ['input', 'int']:
-                        errors.append(f"Unsupported function call '{expr['func_name']}' in assignment.")
-            elif statement['type'] == 'FOR_LOOP':
-                if 'iterator' not in statement or not statement['iterator']:
-                    errors.append("For loop must have a valid iterator variable.")
-                if 'limit' in statement:
-                    if 'start' in statement or 'stop' in statement or 'step' in statement:
-                        errors.append("For loop with 'limit' cannot have 'start', 'stop', or 'step'.")
-                else:
-                    if 'start' not in statement:
-                        errors.append("For loop with multiple arguments must have a start value.")
-                    if 'stop' not in statement:
-                        errors.append("For loop with multiple arguments must have a stop value.")
-                if 'body' not in statement:
-                    errors.append("For loop must have a body.")
-                else:
-                    if not isinstance(statement['body'], list):
-                        errors.append("For loop body must be a list of statements.")
-                    else:
-                        for stmt in statement['body']:
-                            sub_errors = self.analyze({'statements': [stmt]})
-                            errors.extend(sub_errors)
-            elif statement['type'] == 'WHILE_LOOP':
-                if 'condition' not in statement:
-                    errors.append("While loop must have a condition.")
-                if 'body' not in statement:
-                    errors.append("While loop must have a body.")
-                else:
-                    if statement['condition']['type'] not in ['BINARY_EXPRESSION', 'IDENTIFIER', 'NUMBER', 'STRING_LITERAL', 'FUNCTION_CALL']:
-                        errors.append(f"Invalid condition type in while loop: {statement['condition']['type']}")
-                    if not isinstance(statement['body'], list):
-                        errors.append("While loop body must be a list of statements.")
-                    else:
-                        for stmt in statement['body']:
-                            sub_errors = self.analyze({'statements': [stmt]})
-                            errors.extend(sub_errors)
-            elif statement['type'] == 'IF_STATEMENT':
-                if 'condition' not in statement:
-                    errors.append("If statement must have a condition.")
-                if 'true_branch' not in statement:
-                    errors.append("If statement must have a true branch.")
+        dispatch = self._dispatch
+        stack = list(reversed(ast['statements']))
+        pop = stack.pop
+        while stack:
+            statement = pop()
+            handler = dispatch.get(type(statement))
+            if handler is not None:
+                handler(statement, errors, stack)
+            else:
+                errors.append(f"Unsupported statement type: {statement.type}")
+        return errors
+
+    def _analyze_print(self, statement, errors, stack):
+        if not statement.args:
+            errors.append("Print statement must have at least one argument to print.")
+        else:
+            for arg in statement.args:
+                if type(arg) not in _EXPRESSION_NODES:
+                    errors.append(f"Print statement only supports string literals, identifiers, binary expressions, numbers, or function calls. Found: {arg.type}")
+
+    def _analyze_assignment(self, statement, errors, stack):
+        if statement.expression is None:
+            errors.append(f"Assignment for variable '{statement.var_name}' must have an expression.")
+        else:
+            if not isinstance(statement.var_name, str) or not statement.var_name:
+                errors.append(f"Assignment must have a valid variable name, got: {statement.var_name}")
+            expr = statement.expression
+            if type(expr) is FuncCall and expr.func_name not in _ASSIGNABLE_CALLS:
+                errors.append(f"Unsupported function call '{expr.func_name}' in assignment.")
+
+    def _analyze_for(self, statement, errors, stack):
+        if not statement.iterator:
+            errors.append("For loop must have a valid iterator variable.")
+        # range() arguments that were not given are left unset on the node
+        if hasattr(statement, 'limit'):
+            if hasattr(statement, 'start') or hasattr(statement, 'stop') or hasattr(statement, 'step'):
+                errors.append("For loop with 'limit' cannot have 'start', 'stop', or 'step'.")
+        else:
+            if not hasattr(statement, 'start'):
+                errors.append("For loop with multiple arguments must have a start value.")
+            if not hasattr(statement, 'stop'):
+                errors.append("For loop with multiple arguments must have a stop value.")
+        if statement.body is None:
+            errors.append("For loop must have a body.")
+        elif not isinstance(statement.body, list):
+            errors.append("For loop body must be a list of statements.")
+        else:
+            stack.extend(reversed(statement.body))
+
+    def _analyze_while(self, statement, errors, stack):
+        if statement.condition is None:
+            errors.append("While loop must have a condition.")
+        if statement.body is None:
+            errors.append("While loop must have a body.")
+        else:
+            if type(statement.condition) not in _EXPRESSION_NODES:
+                errors.append(f"Invalid condition type in while loop: {statement.condition.type}")
+            if not isinstance(statement.body, list):
+                errors.append("While loop body must be a list of statements.")
+            else:
+                stack.extend(reversed(statement.body))
+
+    def _analyze_if(self, statement, errors, stack):
+        if statement.condition is None:
+            errors.append("If statement must have a condition.")
+        if statement.true_branch is None:
+            errors.append("If statement must have a true branch.")
+        else:
+            if type(statement.condition) not in _EXPRESSION_NODES:
+                errors.append(f"Invalid condition type in if statement: {statement.condition.type}")
+            # Push the false branch first so the true branch is analyzed before it; BLOCK branches
+            # contribute their statements
+            if statement.false_branch is not None:
+                if type(statement.false_branch) is Block:
+                    stack.extend(reversed(statement.false_branch.statements))
                 else:
-                    if statement['condition']['type'] not in ['BINARY_EXPRESSION', 'IDENTIFIER', 'NUMBER', 'STRING_LITERAL', 'FUNCTION_CALL']:
-                        errors.append(f"Invalid condition type in if statement: {statement['condition']['type']}")
-                    # Handle BLOCK in true_branch
-                    if statement['true_branch']['type'] == 'BLOCK':
-                        sub_errors = self.analyze({'statements': statement['true_branch']['statements']})
-                    else:
-                        sub_errors = self.analyze({'statements': [statement['true_branch']]})
-                    errors.extend(sub_errors)
-                    # Handle BLOCK in false_branch
-                    if statement.get('false_branch'):
-                        if statement['false_branch']['type'] == 'BLOCK':
-                            sub_errors = self.analyze({'statements': statement['false_branch']['statements']})
-                        else:
-                            sub_errors = self.analyze({'statements': [statement['false_branch']]})
-                        errors.extend(sub_errors)
-            elif statement['type'] == 'FUNCTION_CALL':
-                if 'func_name' not in statement or 'args' not in statement:
-                    errors.append("Function call must have a name and arguments.")
-            elif statement['type'] == 'RETURN_STATEMENT':
-                if 'expression' not in statement:
-                    errors.append("Return statement must have an expression.")
-            elif statement['type'] == 'VARIABLE_DECLARATION':
-                if 'var_type' not in statement or 'var_name' not in statement:
-                    errors.append("Variable declaration must have a type and name.")
-                if statement.get('initializer') and statement['initializer']['type'] not in ['NUMBER', 'STRING_LITERAL', 'IDENTIFIER', 'BINARY_EXPRESSION', 'FUNCTION_CALL']:
-                    errors.append(f"Variable initializer must be a valid expression, got: {statement['initializer']['type']}")
-            elif statement['type'] == 'IO_STATEMENT':
-                if 'io_operator' not in statement or 'expression' not in statement:
-                    errors.append("IO statement must have an operator and expression.")
-            elif statement['type'] == 'BLOCK':  # Add BLOCK handling
-                sub_errors = self.analyze({'statements': statement['statements']})
-                errors.extend(sub_errors)
+                    stack.append(statement.false_branch)
+            if type(statement.true_branch) is Block:
+                stack.extend(reversed(statement.true_branch.statements))
             else:
-                errors.append(f"Unsupported statement type: {statement['type']}")
-        return errors
\ No newline at end of file
+                stack.append(statement.true_branch)
+
+    def _analyze_function_call(self, statement, errors, stack):
+        if statement.func_name is None or statement.args is None:
+            errors.append("Function call must have a name and arguments.")
+
+    def _analyze_return(self, statement, errors, stack):
+        if statement.expression is None:
+            errors.append("Return statement must have an expression.")
+
+    def _analyze_variable_declaration(self, statement, errors, stack):
+        if statement.var_type is None or statement.var_name is None:
+            errors.append("Variable declaration must have a type and name.")
+        # The initializer is left unset on declarations without one
+        initializer = getattr(statement, 'initializer', None)
+        if initializer is not None and type(initializer) not in _EXPRESSION_NODES:
+            errors.append(f"Variable initializer must be a valid expression, got: {initializer.type}")
+
+    def _analyze_io(self, statement, errors, stack):
+        if statement.io_operator is None or statement.expression is None:
+            errors.append("IO statement must have an operator and expression.")
+
+    def _analyze_block(self, statement, errors, stack):
+        stack.extend(reversed(statement.statements))
\ No newline at end of file
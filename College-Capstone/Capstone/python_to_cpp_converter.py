@@ -1,9 +1,37 @@
+import operator
+
+# Fixed text around the generated declarations and statements
+_PROGRAM_HEADER = "#include <iostream>\n#include <string>\nusing namespace std;\n\nint main() {"
+_PROGRAM_FOOTER = "    return 0;\n}"
+
+_IND4 = "    "  # Indent of a statement in main()
+_IND8 = "        "  # Indent of a statement inside an if/while/for body
+
+# Join lines, each starting with indent. The indent rides on the separator, so lines aren't copied one by one
+def _indent_lines(lines, indent):
+    return indent + ("\n" + indent).join(lines) if lines else ""
+
+# Arithmetic folded when both operands are integer literals. Literals are never negative, so floor division
+# and modulo agree with C++'s truncating ones
+_FOLDABLE_OPERATORS = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.floordiv, "%": operator.mod}
+_INT_MIN, _INT_MAX = -2**31, 2**31 - 1  # A folded value outside int would have overflowed at run time
+
+# Value of a NUMBER literal C++ reads as a decimal int, or None (floats, and octal like 010)
+def _int_literal(value):
+    if value.isdigit() and (value[0] != "0" or len(value) == 1):
+        return int(value)
+    return None
+
+_LITERAL_VALUE_TYPES = {"NUMBER": "number", "STRING_LITERAL": "string"}  # Inferred type of each literal
+_CALL_VALUE_TYPES = {"input": "string", "int": "number"}  # Inferred result type of known functions
+
 # Class to convert Python AST to C++ code
 class PythonToCppConverter:
-    def __init__(self, ast):
+    def __init__(self, ast, verbose=False):
         self.ast = ast  # Abstract Syntax Tree from Python code
+        self.verbose = verbose  # Print per-node trace output; its f-strings are only built when set
         self.variables = set()  # Track declared variables
-        self.declarations = []  # Store variable declarations
+        self.declarations = []  # Lines emitted ahead of the statements; process_program declares in place
         self.statements = []  # Store executable statements
 
     # Generate complete C++ code from AST
@@ -11,177 +39,237 @@ class PythonToCppConverter:
         self.process_program(self.ast)
         declarations = "\n".join(self.declarations)
         statements = "\n".join(self.statements)
-        return f"#include <iostream>\n#include <string>\nusing namespace std;\n\nint main() {{\n{declarations}\n{statements}\n    return 0;\n}}"
+        return "\n".join((_PROGRAM_HEADER, declarations, statements, _PROGRAM_FOOTER))
 
     # Process the root PROGRAM node
     def process_program(self, node):
-        if node["type"] == "PROGRAM":
-            for stmt in node["statements"]:
+        if node.type == "PROGRAM":
+            # Everything stays in source order: a first assignment declares its variable in place, since
+            # hoisting it would run input() prompts and reads of reassigned variables out of order
+            append = self.statements.append
+            for stmt in node.statements:
                 result = self.process_node(stmt)
                 if result:
-                    # Separate declarations from statements
-                    if stmt["type"] == "ASSIGNMENT" and stmt["var_name"] not in self.variables:
-                        self.declarations.append(result.rstrip())
-                    else:
-                        self.statements.append(result.rstrip())
+                    append(result.rstrip())
 
     # Process individual AST nodes
     def process_node(self, node):
-        print(f"Processing node: {node['type']}")
-        if node["type"] == "ASSIGNMENT":
-            var_name = node["var_name"]
-            expr = node["expression"]
-            # Handle compound assignments (e.g., i += 1)
-            if (expr["type"] == "BINARY_EXPRESSION" and 
-                expr["operator"] in ["+", "-", "*", "/", "%"] and 
-                expr["left"]["type"] == "IDENTIFIER" and 
-                expr["left"]["value"] == var_name):
-                operator = expr["operator"]
-                right = self.generate_expression(expr["right"])
-                if var_name not in self.variables:
-                    self.variables.add(var_name)
-                    var_type = self.determine_value_type(expr["right"])
-                    if var_type == "string":
-                        return f"    string {var_name} = {right};\n    {var_name} {operator}= {right};"
-                    elif var_type == "number":
-                        return f"    int {var_name} = {right};\n    {var_name} {operator}= {right};"
-                    else:
-                        return f"    auto {var_name} = {right};\n    {var_name} {operator}= {right};"
-                return f"    {var_name} {operator}= {right};"
-            # Regular assignment
-            expr_result = self.generate_expression(expr, var_name)
+        if self.verbose:
+            print(f"Processing node: {node.type}")
+        handler = self._NODE_HANDLERS.get(node.type)
+        return handler(self, node) if handler is not None else ""
+
+    # Declare a variable on its first assignment, otherwise assign to it
+    def _process_assignment(self, node):
+        var_name = node.var_name
+        expr = node.expression
+        # Handle compound assignments (e.g., i += 1)
+        if (expr.type == "BINARY_EXPRESSION" and 
+            expr.operator in ["+", "-", "*", "/", "%"] and 
+            expr.left.type == "IDENTIFIER" and 
+            expr.left.value == var_name):
+            operator = expr.operator
+            right = self.generate_expression(expr.right)
             if var_name not in self.variables:
                 self.variables.add(var_name)
-                var_type = self.determine_value_type(expr)
+                var_type = self.determine_value_type(expr.right)
                 if var_type == "string":
-                    if expr_result.startswith("    cout"):
-                        return f"    string {var_name};\n{expr_result}"
-                    return f"    string {var_name} = {expr_result};"
+                    return f"    string {var_name} = {right};\n    {var_name} {operator}= {right};"
                 elif var_type == "number":
-                    if expr_result.startswith("    cout"):
-                        return f"    int {var_name};\n{expr_result}"
-                    return f"    int {var_name} = {expr_result};"
+                    return f"    int {var_name} = {right};\n    {var_name} {operator}= {right};"
                 else:
-                    return f"    auto {var_name} = {expr_result};"
-            return f"    {var_name} = {expr_result};" if expr_result else ""
-        elif node["type"] == "PRINT_STATEMENT":
-            # Convert Python print to C++ cout
-            cpp_args = [self.generate_expression(arg, wrap_binary=True) for arg in node["args"]]
-            result = f'    cout << {" << ".join(cpp_args)} << endl;'
+                    return f"    auto {var_name} = {right};\n    {var_name} {operator}= {right};"
+            return f"    {var_name} {operator}= {right};"
+        # Regular assignment
+        expr_result = self.generate_expression(expr, var_name)
+        if var_name not in self.variables:
+            self.variables.add(var_name)
+            var_type = self.determine_value_type(expr)
+            if var_type == "string":
+                if expr_result.startswith("    cout"):
+                    return f"    string {var_name};\n{expr_result}"
+                return f"    string {var_name} = {expr_result};"
+            elif var_type == "number":
+                if expr_result.startswith("    cout"):
+                    return f"    int {var_name};\n{expr_result}"
+                return f"    int {var_name} = {expr_result};"
+            else:
+                return f"    auto {var_name} = {expr_result};"
+        return f"    {var_name} = {expr_result};" if expr_result else ""
+
+    # Convert Python print to C++ cout
+    def _process_print(self, node):
+        cpp_args = []
+        for arg in node.args:
+            cpp_args.extend(self.generate_expression(operand, wrap_binary=True) for operand in self._flatten_concat(arg))
+        result = f'    cout << {" << ".join(cpp_args)} << endl;'
+        if self.verbose:
             print(f"PRINT result: {result}")
-            return result
-        elif node["type"] == "IF_STATEMENT":
-            # Handle if/elif/else constructs
-            condition = self.generate_expression(node["condition"])
-            true_branch = node["true_branch"]
-            if true_branch["type"] == "BLOCK":
-                body_lines = [self.process_node(stmt) for stmt in true_branch["statements"]]
-                body = "\n".join(f"        {line}" for line in body_lines if line)
+        return result
+
+    # Handle if/elif/else constructs
+    def _process_if(self, node):
+        condition = self.generate_expression(node.condition)
+        # Lines are collected and joined once, so long elif chains don't re-copy the result
+        parts = [f'    if ({condition}) {{', self._render_body(node.true_branch), '    }']
+        false_branch = node.false_branch
+        while false_branch:
+            if false_branch.type == "IF_STATEMENT":
+                elif_condition = self.generate_expression(false_branch.condition)
+                parts += (f'    else if ({elif_condition}) {{', self._render_body(false_branch.true_branch), '    }')
+                false_branch = false_branch.false_branch
             else:
-                body = self.process_node(true_branch)
-                body = f"        {body}" if body else ""
-            result = f'    if ({condition}) {{\n{body}\n    }}'
-            false_branch = node.get("false_branch")
-            while false_branch:
-                if false_branch["type"] == "IF_STATEMENT":
-                    elif_condition = self.generate_expression(false_branch["condition"])
-                    elif_true_branch = false_branch["true_branch"]
-                    if elif_true_branch["type"] == "BLOCK":
-                        elif_body_lines = [self.process_node(stmt) for stmt in elif_true_branch["statements"]]
-                        elif_body = "\n".join(f"        {line}" for line in elif_body_lines if line)
-                    else:
-                        elif_body = self.process_node(elif_true_branch)
-                        elif_body = f"        {elif_body}" if elif_body else ""
-                    result += f'\n    else if ({elif_condition}) {{\n{elif_body}\n    }}'
-                    false_branch = false_branch.get("false_branch")
-                elif false_branch["type"] == "BLOCK":
-                    else_body_lines = [self.process_node(stmt) for stmt in false_branch["statements"]]
-                    else_body = "\n".join(f"        {line}" for line in else_body_lines if line)
-                    result += f'\n    else {{\n{else_body}\n    }}'
-                    break
-                else:
-                    else_body = self.process_node(false_branch)
-                    else_body = f"        {else_body}" if else_body else ""
-                    result += f'\n    else {{\n{else_body}\n    }}'
-                    break
+                parts += ('    else {', self._render_body(false_branch), '    }')
+                break
+        result = "\n".join(parts)
+        if self.verbose:
             print(f"Full IF result: {result}")
-            return result
-        elif node["type"] == "WHILE_LOOP":
-            # Convert Python while to C++ while
-            condition = self.generate_expression(node["condition"])
-            body_lines = [self.process_node(stmt) for stmt in node["body"]]
-            body = "\n".join(f"        {line.rstrip()}" for line in body_lines if line)
-            result = f'    while ({condition}) {{\n{body}\n    }}'
+        return result
+
+    # Indented lines of an if/elif/else branch, which is a BLOCK or a single statement
+    def _render_body(self, branch):
+        statements = branch.statements if branch.type == "BLOCK" else (branch,)
+        return _indent_lines([line for line in map(self.process_node, statements) if line], _IND8)
+
+    # Convert Python while to C++ while
+    def _process_while(self, node):
+        condition = self.generate_expression(node.condition)
+        body = _indent_lines([line.rstrip() for line in map(self.process_node, node.body) if line], _IND8)
+        result = f'    while ({condition}) {{\n{body}\n    }}'
+        if self.verbose:
             print(f"WHILE condition: {condition}, body: {body}")
             print(f"Full WHILE result: {result}")
-            return result
-        elif node["type"] == "FOR_LOOP":
-            # Convert Python for to C++ for
-            iterator = node["iterator"]
-            start = self.generate_expression(node["start"]) if "start" in node else "0"
-            stop = self.generate_expression(node["stop"]) if "stop" in node else self.generate_expression(node["limit"])
-            step = self.generate_expression(node["step"]) if "step" in node else "1"
-            body_lines = [self.process_node(stmt) for stmt in node["body"]]
-            body = "\n".join(f"        {line.rstrip()}" for line in body_lines if line)
-            increment = f"{iterator}++" if step == "1" else f"{iterator} += {step}"
-            if iterator not in self.variables:
-                self.variables.add(iterator)
-                result = f"    for (int {iterator} = {start}; {iterator} < {stop}; {increment}) {{\n{body}\n    }}"
-            else:
-                result = f"    for ({iterator} = {start}; {iterator} < {stop}; {increment}) {{\n{body}\n    }}"
+        return result
+
+    # Convert Python for to C++ for
+    def _process_for(self, node):
+        iterator = node.iterator
+        # range() arguments that were not given are left unset on the node
+        start = self.generate_expression(node.start) if hasattr(node, "start") else "0"
+        stop = self.generate_expression(node.stop) if hasattr(node, "stop") else self.generate_expression(node.limit)
+        step = self.generate_expression(node.step) if hasattr(node, "step") else "1"
+        body = _indent_lines([line.rstrip() for line in map(self.process_node, node.body) if line], _IND8)
+        increment = f"{iterator}++" if step == "1" else f"{iterator} += {step}"
+        if iterator not in self.variables:
+            self.variables.add(iterator)
+            result = f"    for (int {iterator} = {start}; {iterator} < {stop}; {increment}) {{\n{body}\n    }}"
+        else:
+            result = f"    for ({iterator} = {start}; {iterator} < {stop}; {increment}) {{\n{body}\n    }}"
+        if self.verbose:
             print(f"FOR_LOOP iterator: {iterator}, start: {start}, stop: {stop}, step: {step}, body: {body}")
             print(f"Full FOR_LOOP result: {result}")
-            return result
-        elif node["type"] == "BLOCK":
-            # Process block statements
-            body_lines = [self.process_node(stmt) for stmt in node["statements"]]
-            body = "\n".join(f"    {line.strip()}" for line in body_lines if line)
+        return result
+
+    # Process block statements
+    def _process_block(self, node):
+        body = _indent_lines([line.strip() for line in map(self.process_node, node.statements) if line], _IND4)
+        if self.verbose:
             print(f"BLOCK content: {body}")
-            return body
-        return ""
+        return body
 
     # Generate C++ expressions from AST nodes
     def generate_expression(self, node, target_var=None, wrap_binary=False):
-        if node["type"] == "STRING_LITERAL":
-            return f'"{node["value"][1:-1]}"'  # Strip Python quotes
-        elif node["type"] == "IDENTIFIER":
-            return node["value"]
-        elif node["type"] == "NUMBER":
-            return node["value"]
-        elif node["type"] == "BINARY_EXPRESSION":
-            left = self.generate_expression(node["left"])
-            right = self.generate_expression(node["right"])
-            expr = f"{left} {node['operator']} {right}"
-            return f"({expr})" if wrap_binary else expr
-        elif node["type"] == "FUNCTION_CALL":
-            func_name = node["func_name"]
-            args = [self.generate_expression(arg) for arg in node["args"]]
-            if func_name == "input" and target_var:
-                prompt = args[0] if args else '""'
+        node_type = node.type
+        if node_type == "IDENTIFIER" or node_type == "NUMBER":
+            return node.value
+        handler = self._EXPRESSION_HANDLERS.get(node_type)
+        return handler(self, node, target_var, wrap_binary) if handler is not None else ""
+
+    # Emit a string literal with C++ double quotes
+    def _generate_string(self, node, target_var, wrap_binary):
+        return f'"{node.value[1:-1]}"'  # Strip Python quotes
+
+    # Emit a binary expression, parenthesized when it is a cout operand
+    def _generate_binary(self, node, target_var, wrap_binary):
+        folded = self._fold_literals(node)
+        if folded is not None:
+            return folded
+        expr = self._binary_text(node)
+        return f"({expr})" if wrap_binary else expr
+
+    # Operands are written without parentheses, so C++ regroups nested operators by its own precedence.
+    # Nested operators are never folded, since their folded value could land in a different group
+    def _binary_text(self, node):
+        left = node.left
+        right = node.right
+        left = self._binary_text(left) if left.type == "BINARY_EXPRESSION" else self.generate_expression(left)
+        right = self._binary_text(right) if right.type == "BINARY_EXPRESSION" else self.generate_expression(right)
+        return f"{left} {node.operator} {right}"
+
+    # Literal result of an operator applied to two literals, or None if it must be left to C++
+    def _fold_literals(self, node):
+        left = node.left
+        right = node.right
+        if left.type == "NUMBER" and right.type == "NUMBER":
+            fold = _FOLDABLE_OPERATORS.get(node.operator)
+            left_value = _int_literal(left.value)
+            right_value = _int_literal(right.value)
+            if fold is None or left_value is None or right_value is None:
+                return None
+            if right_value == 0 and fold in (operator.floordiv, operator.mod):
+                return None
+            value = fold(left_value, right_value)
+            return str(value) if _INT_MIN <= value <= _INT_MAX else None
+        if left.type == "STRING_LITERAL" and right.type == "STRING_LITERAL" and node.operator == "+":
+            return f'"{left.value[1:-1]}{right.value[1:-1]}"'  # Two const char* can't be added in C++
+        return None
+
+    # Turn input()/int(input()) assigned to target_var into cout/cin
+    def _generate_call(self, node, target_var, wrap_binary):
+        func_name = node.func_name
+        args = [self.generate_expression(arg) for arg in node.args]
+        if func_name == "input" and target_var:
+            prompt = args[0] if args else '""'
+            return f'    cout << {prompt};\n    cin >> {target_var};'
+        elif func_name == "int" and target_var:
+            nested_input = node.args[0]
+            if nested_input.type == "FUNCTION_CALL" and nested_input.func_name == "input":
+                prompt = self.generate_expression(nested_input.args[0]) if nested_input.args else '""'
                 return f'    cout << {prompt};\n    cin >> {target_var};'
-            elif func_name == "int" and target_var:
-                nested_input = node["args"][0]
-                if nested_input["type"] == "FUNCTION_CALL" and nested_input["func_name"] == "input":
-                    prompt = self.generate_expression(nested_input["args"][0]) if nested_input["args"] else '""'
-                    return f'    cout << {prompt};\n    cin >> {target_var};'
-            return ""
         return ""
 
+    # Operands of a string + chain, so print writes each with its own << instead of concatenating first.
+    # Only sub-chains that are themselves strings are split; numeric sums like (x + y) stay whole
+    def _flatten_concat(self, node):
+        operands = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if (current.type == "BINARY_EXPRESSION" and current.operator == "+"
+                    and self.determine_value_type(current) == "string"):
+                stack.append(current.right)
+                stack.append(current.left)
+            else:
+                operands.append(current)
+        return operands
+
     # Infer variable type from expression
     def determine_value_type(self, node):
-        if node["type"] == "NUMBER":
-            return "number"
-        elif node["type"] == "STRING_LITERAL":
-            return "string"
-        elif node["type"] == "FUNCTION_CALL":
-            if node["func_name"] == "input":
-                return "string"
-            elif node["func_name"] == "int":
-                return "number"
-        elif node["type"] == "BINARY_EXPRESSION" and node["operator"] == "+":
-            left_type = self.determine_value_type(node["left"])
-            right_type = self.determine_value_type(node["right"])
+        node_type = node.type
+        value_type = _LITERAL_VALUE_TYPES.get(node_type)
+        if value_type is not None:
+            return value_type
+        if node_type == "FUNCTION_CALL":
+            return _CALL_VALUE_TYPES.get(node.func_name, "unknown")
+        if node_type == "BINARY_EXPRESSION" and node.operator == "+":
+            left_type = self.determine_value_type(node.left)
+            right_type = self.determine_value_type(node.right)
             if "string" in (left_type, right_type):
                 return "string"
             return "number"
-        return "unknown"
\ No newline at end of file
+        return "unknown"
+
+    # Handlers by node type, called as handler(self, node, ...)
+    _NODE_HANDLERS = {
+        "ASSIGNMENT": _process_assignment,
+        "PRINT_STATEMENT": _process_print,
+        "IF_STATEMENT": _process_if,
+        "WHILE_LOOP": _process_while,
+        "FOR_LOOP": _process_for,
+        "BLOCK": _process_block,
+    }
+    _EXPRESSION_HANDLERS = {
+        "STRING_LITERAL": _generate_string,
+        "BINARY_EXPRESSION": _generate_binary,
+        "FUNCTION_CALL": _generate_call,
+    }
\ No newline at end of file
@@ -1,7 +1,17 @@
+_MISSING = object()  # .get() default telling an absent field apart from one set to None
+
+# Types that convert into each other. A tuple rather than a frozenset: the type tested against it can be
+# a symbol-table entry (a dict) when an identifier names a function, and that can't be hashed
+_NUMERIC_TYPES = ('int', 'float')
+_COMPARISON_OPERATORS = frozenset(('>', '<', '>=', '<=', '==', '!='))  # Operators whose result is bool
+
 # Manages semantic analysis of an abstract syntax tree (AST) by tracking scopes and variables
 class SemanticAnalyzer:
+    __slots__ = ('global_scope', 'scope_stack', 'current_class')
+
     def __init__(self):
-        self.scope_stack = [{}]  # Stack of scopes, starting with global scope
+        self.global_scope = {}  # Functions, classes and globals; always scope_stack[0]
+        self.scope_stack = [self.global_scope]  # Stack of scopes, starting with global scope
         self.current_class = None  # Tracks current class context for methods
 
     # Retrieves the innermost scope from the scope stack
@@ -18,7 +28,7 @@ class SemanticAnalyzer:
 
     # Adds a variable to the current scope, checking for redeclarations or shadowing
     def declare_variable(self, var_name, var_type, errors, is_member=False):
-        scope = self.current_scope()
+        scope = self.scope_stack[-1]
         if var_name in scope:
             errors.append(f"Error: Variable '{var_name}' already declared in this scope.")
         elif self.lookup_variable(var_name) is not None and not is_member:
@@ -26,11 +36,34 @@ class SemanticAnalyzer:
         else:
             scope[var_name] = var_type
 
+    # Adds function or method parameters to the scope just entered for its body. Only earlier parameters can
+    # be in that scope yet, so the shadowing check walks the enclosing scopes, which don't change meanwhile
+    def declare_parameters(self, params, errors):
+        scope = self.scope_stack[-1]
+        outer_scopes = self.scope_stack[-2::-1]
+        for param in params:
+            var_name = param['name']
+            var_type = param['type']
+            if var_name in scope:
+                errors.append(f"Error: Variable '{var_name}' already declared in this scope.")
+                continue
+            for outer_scope in outer_scopes:
+                outer_type = outer_scope.get(var_name, _MISSING)
+                if outer_type is not _MISSING:
+                    break
+            else:
+                outer_type = None
+            if outer_type is not None:
+                errors.append(f"Warning: Variable '{var_name}' shadows a declaration in an outer scope.")
+            else:
+                scope[var_name] = var_type
+
     # Searches for a variable in all scopes, from innermost to outermost
     def lookup_variable(self, var_name):
         for scope in reversed(self.scope_stack):
-            if var_name in scope:
-                return scope[var_name]
+            var_type = scope.get(var_name, _MISSING)
+            if var_type is not _MISSING:
+                return var_type
         return None
 
     # Performs semantic analysis on the entire AST and collects errors
@@ -71,7 +104,7 @@ class SemanticAnalyzer:
         var_type = self.lookup_variable(var_name)
         if var_type is None:
             errors.append(f"Error: Variable '{var_name}' not declared for increment operation.")
-        elif var_type not in ['int', 'float']:
+        elif var_type not in _NUMERIC_TYPES:
             errors.append(f"Warning: Increment operation on non-numeric type '{var_type}' for variable '{var_name}'.")
 
     # Checks the semantics of an expression used as a standalone statement
@@ -82,7 +115,7 @@ class SemanticAnalyzer:
                 var_type = self.lookup_variable(expression['var_name'])
                 if var_type is None:
                     errors.append(f"Error: Variable '{expression['var_name']}' not declared for increment.")
-                elif var_type not in ['int', 'float']:
+                elif var_type not in _NUMERIC_TYPES:
                     errors.append(f"Warning: Increment operation on non-numeric type '{var_type}' for variable '{expression['var_name']}'.")
             else:
                 self.evaluate_expression_type(expression, errors, "expression statement")
@@ -91,13 +124,20 @@ class SemanticAnalyzer:
 
     # Analyzes a block of statements within its own scope
     def analyze_block(self, block, errors):
-        if not isinstance(block, dict) or 'statements' not in block:
+        try:
+            statements = block['statements']
+        except (TypeError, KeyError):
             errors.append("Invalid block structure. Expected a dictionary with 'statements' key.")
             return
-        self.enter_scope()
-        for statement in block['statements']:
+        self._analyze_scoped_statements(statements, errors)
+
+    # Analyzes statements in a new scope that is removed afterwards
+    def _analyze_scoped_statements(self, statements, errors):
+        scope_stack = self.scope_stack
+        scope_stack.append({})  # enter_scope(), inlined on the per-block path
+        for statement in statements:
             self.analyze_statement(statement, errors)
-        self.exit_scope()
+        scope_stack.pop()
 
     # Validates a function definition and its body
     def analyze_function(self, function, errors):
@@ -109,23 +149,26 @@ class SemanticAnalyzer:
         for param in params:
             if 'name' not in param or 'type' not in param:
                 errors.append("Function parameter must have 'name' and 'type' fields.")
-        if func_name in self.scope_stack[0]:
+        if func_name in self.global_scope:
             errors.append(f"Error: Function '{func_name}' already declared.")
         else:
-            self.scope_stack[0][func_name] = {
+            self.global_scope[func_name] = {
                 'type': 'function',
                 'params': {param['name']: param['type'] for param in params},
                 'return_type': function.get('return_type', 'void')
             }
         self.enter_scope()
-        for param in params:
-            self.declare_variable(param['name'], param['type'], errors)
-        if isinstance(function['body'], list):
-            self.analyze_block({'statements': function['body']}, errors)
-        elif isinstance(function['body'], dict) and 'statements' in function['body']:
-            self.analyze_block(function['body'], errors)
+        self.declare_parameters(params, errors)
+        body = function['body']
+        if isinstance(body, list):
+            self._analyze_scoped_statements(body, errors)
         else:
-            errors.append("Invalid function body structure. Expected a list or dictionary with 'statements' key.")
+            try:
+                statements = body['statements']
+            except (TypeError, KeyError):
+                errors.append("Invalid function body structure. Expected a list or dictionary with 'statements' key.")
+            else:
+                self._analyze_scoped_statements(statements, errors)
         self.exit_scope()
 
     # Analyzes a variable declaration and checks type compatibility
@@ -148,11 +191,7 @@ class SemanticAnalyzer:
     def _is_type_compatible(self, declared_type, expr_type):
         if declared_type == expr_type:
             return True
-        if declared_type in ['int', 'float'] and expr_type in ['int', 'float']:
-            return True
-        if declared_type == 'string' and expr_type == 'string':
-            return True
-        return False
+        return declared_type in _NUMERIC_TYPES and expr_type in _NUMERIC_TYPES
 
     # Ensures type correctness in assignment statements
     def check_assignment(self, statement, errors):
@@ -171,15 +210,18 @@ class SemanticAnalyzer:
 
     # Validates the structure and semantics of an if statement
     def analyze_if_statement(self, statement, errors):
-        if 'condition' not in statement or 'true_branch' not in statement:
+        condition = statement.get('condition', _MISSING)
+        true_branch = statement.get('true_branch', _MISSING)
+        if condition is _MISSING or true_branch is _MISSING:
             errors.append("If statement must have 'condition' and 'true_branch' fields.")
             return
-        condition_type = self.evaluate_expression_type(statement['condition'], errors, "if statement condition")
+        condition_type = self.evaluate_expression_type(condition, errors, "if statement condition")
         if condition_type != 'bool':
             errors.append(f"Error: Condition in if statement must be of type 'bool', got {condition_type}.")
-        self.analyze_statement(statement['true_branch'], errors)
-        if 'false_branch' in statement and statement['false_branch'] is not None:
-            self.analyze_statement(statement['false_branch'], errors)
+        self.analyze_statement(true_branch, errors)
+        false_branch = statement.get('false_branch')
+        if false_branch is not None:
+            self.analyze_statement(false_branch, errors)
 
     # Checks the semantics of a while loop, including its condition and body
     def analyze_while_loop(self, while_loop, errors):
@@ -220,18 +262,20 @@ class SemanticAnalyzer:
     def evaluate_expression_type(self, expression, errors=None, context="expression"):
         if errors is None:
             errors = []  # Fallback for cases where errors aren't passed
-        if expression['type'] == 'NUMBER':
+        expression_type = expression['type']  # Read once
+        if expression_type == 'NUMBER':
             return 'int'
-        elif expression['type'] == 'IDENTIFIER':
-            var_type = self.lookup_variable(expression['value'])
+        elif expression_type == 'IDENTIFIER':
+            var_name = expression['value']
+            var_type = self.lookup_variable(var_name)
             if var_type is None:
-                errors.append(f"Error: Variable '{expression['value']}' not declared in {context}.")
+                errors.append(f"Error: Variable '{var_name}' not declared in {context}.")
             return var_type
-        elif expression['type'] == 'BINARY_EXPRESSION':
-            left_type = self.evaluate_expression_type(expression['left'], errors, f"left operand of '{expression['operator']}' in {context}")
-            right_type = self.evaluate_expression_type(expression['right'], errors, f"right operand of '{expression['operator']}' in {context}")
+        elif expression_type == 'BINARY_EXPRESSION':
             operator = expression['operator']
-            if operator in ['>', '<', '>=', '<=', '==', '!=']:
+            left_type = self.evaluate_expression_type(expression['left'], errors, f"left operand of '{operator}' in {context}")
+            right_type = self.evaluate_expression_type(expression['right'], errors, f"right operand of '{operator}' in {context}")
+            if operator in _COMPARISON_OPERATORS:
                 if left_type and right_type:
                     if left_type == right_type:
                         return 'bool'
@@ -248,9 +292,9 @@ class SemanticAnalyzer:
                 else:
                     errors.append(f"Error: Invalid types '{left_type}' and '{right_type}' for operator '{operator}' in {context}.")
                     return None
-        elif expression['type'] == 'STRING_LITERAL':
+        elif expression_type == 'STRING_LITERAL':
             return 'string'
-        elif expression['type'] == 'FUNCTION_CALL':
+        elif expression_type == 'FUNCTION_CALL':
             func_name = expression['func_name']
             func_info = self.lookup_variable(func_name)
             if func_info and func_info['type'] == 'function':
@@ -258,10 +302,10 @@ class SemanticAnalyzer:
             else:
                 errors.append(f"Error: Function '{func_name}' not declared in {context}.")
                 return None
-        elif expression['type'] == 'BOOLEAN_LITERAL':
+        elif expression_type == 'BOOLEAN_LITERAL':
             return 'bool'
         else:
-            errors.append(f"Error: Unsupported expression type '{expression['type']}' in {context}.")
+            errors.append(f"Error: Unsupported expression type '{expression_type}' in {context}.")
             return None
 
     # Analyzes a class definition and its members
@@ -270,10 +314,10 @@ class SemanticAnalyzer:
             errors.append("Class definition must have 'class_name' and 'body' fields.")
             return
         class_name = class_def['class_name']
-        if class_name in self.scope_stack[0]:
+        if class_name in self.global_scope:
             errors.append(f"Error: Class '{class_name}' already declared.")
             return
-        self.scope_stack[0][class_name] = {
+        self.global_scope[class_name] = {
             'type': 'class',
             'members': {}
         }
@@ -303,7 +347,7 @@ class SemanticAnalyzer:
         if self.current_class is None:
             errors.append("Error: Method definition outside of a class.")
             return
-        class_info = self.scope_stack[0].get(self.current_class)
+        class_info = self.global_scope.get(self.current_class)
         if method_name in class_info['members']:
             errors.append(f"Error: Method '{method_name}' already declared in class '{self.current_class}'.")
         else:
@@ -313,32 +357,38 @@ class SemanticAnalyzer:
                 'params': {param['name']: param['type'] for param in params}
             }
         self.enter_scope()
-        for param in params:
-            self.declare_variable(param['name'], param['type'], errors)
+        self.declare_parameters(params, errors)
         self.analyze_block(method['body'], errors)
         self.exit_scope()
 
     # Checks the semantics of a for loop, including its components
     def analyze_for_loop(self, for_loop, errors):
-        if 'init' not in for_loop or 'condition' not in for_loop or 'increment' not in for_loop or 'body' not in for_loop:
+        init = for_loop.get('init', _MISSING)
+        condition = for_loop.get('condition', _MISSING)
+        increment = for_loop.get('increment', _MISSING)
+        body = for_loop.get('body', _MISSING)
+        if init is _MISSING or condition is _MISSING or increment is _MISSING or body is _MISSING:
             errors.append("For loop must have 'init', 'condition', 'increment', and 'body' fields.")
             return
-        if for_loop['init']['type'] == 'VARIABLE_DECLARATION':
-            self._analyze_variable_declaration(for_loop['init'], errors)
-        elif for_loop['init']['type'] == 'ASSIGNMENT':
-            self.check_assignment(for_loop['init'], errors)
+        init_type = init['type']
+        if init_type == 'VARIABLE_DECLARATION':
+            self._analyze_variable_declaration(init, errors)
+        elif init_type == 'ASSIGNMENT':
+            self.check_assignment(init, errors)
         else:
-            errors.append(f"Unsupported initialization type '{for_loop['init']['type']}' in for loop.")
-        condition_type = self.evaluate_expression_type(for_loop['condition'], errors, "for loop condition")
+            errors.append(f"Unsupported initialization type '{init_type}' in for loop.")
+        condition_type = self.evaluate_expression_type(condition, errors, "for loop condition")
         if condition_type is not None and condition_type != 'bool':
             errors.append(f"Error: Condition in for loop should evaluate to 'bool', got {condition_type}.")
-        if 'var_name' in for_loop['increment']:
-            var_type = self.lookup_variable(for_loop['increment']['var_name'])
+        inc_var = increment.get('var_name', _MISSING)
+        if inc_var is not _MISSING:
+            var_type = self.lookup_variable(inc_var)
             if var_type is None:
-                errors.append(f"Error: Variable '{for_loop['increment']['var_name']}' for increment not declared.")
-            elif var_type not in ['int', 'float']:
-                errors.append(f"Warning: Increment operation on non-numeric type '{var_type}' for variable '{for_loop['increment']['var_name']}'.")
+                errors.append(f"Error: Variable '{inc_var}' for increment not declared.")
+            elif var_type not in _NUMERIC_TYPES:
+                errors.append(f"Warning: Increment operation on non-numeric type '{var_type}' for variable '{inc_var}'.")
         else:
-            if 'expression' in for_loop['increment']:
-                self.evaluate_expression_type(for_loop['increment']['expression'], errors, "for loop increment")
-        self.analyze_statement(for_loop['body'], errors)
\ No newline at end of file
+            inc_expression = increment.get('expression', _MISSING)
+            if inc_expression is not _MISSING:
+                self.evaluate_expression_type(inc_expression, errors, "for loop increment")
+        self.analyze_statement(body, errors)
\ No newline at end of file
@@ -1,130 +1,261 @@
 import sys
-import tempfile
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QLabel, QComboBox, 
                             QPushButton, QTextEdit, QVBoxLayout, QHBoxLayout, QWidget, 
-                            QMessageBox, QSizePolicy, QGraphicsOpacityEffect)
-from PyQt6.QtGui import (QFont, QIcon, QPixmap, QSyntaxHighlighter, QTextCharFormat, QColor)
-from PyQt6.QtCore import Qt, QRegularExpression, QThread, pyqtSignal
+                            QMessageBox, QSizePolicy)
+from PyQt6.QtGui import (QFont, QIcon, QPixmap, QImageReader, QPainter, QSyntaxHighlighter, QTextCharFormat, QColor)
+from PyQt6.QtCore import Qt, QObject, QRegularExpression, QThread, QTimer, pyqtSignal, pyqtSlot
 import os
 import logging
-from main_cpp import process_file as process_cpp_to_python
-from mainpython import process_file as process_python_to_cpp
+import functools
+import concurrent.futures
+from main_cpp import process_source as process_cpp_to_python
+from mainpython import process_source as process_python_to_cpp
 
 # Configure logging for debugging
 # logging.basicConfig(level=logging.DEBUG)
 
+# Icons and the logo ship next to this file; resolved once at import
+_ASSET_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _asset(name):
+    return os.path.join(_ASSET_DIR, name)
+
+# Decode an image once per size; the window asks for the same icons repeatedly. The reader scales while
+# decoding, so the full-size image is never kept as a pixmap of its own
+@functools.lru_cache(maxsize=32)
+def _icon(path, width, height):
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid():
+        reader.setScaledSize(size.scaled(width, height, Qt.AspectRatioMode.KeepAspectRatio))
+    return QPixmap.fromImage(reader.read())  # Null if the file is missing or unreadable
+
+# Copy of a pixmap with its alpha scaled by opacity, blended once instead of by a graphics effect
+# on every repaint of whatever lies under it
+def _faded(pixmap, opacity):
+    faded = QPixmap(pixmap.size())
+    faded.setDevicePixelRatio(pixmap.devicePixelRatio())
+    faded.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(faded)
+    painter.setOpacity(opacity)
+    painter.drawPixmap(0, 0, pixmap)
+    painter.end()
+    return faded
+
+_ASCII_WHITESPACE = frozenset(" \t\n\r\f\v")  # What \s matches in QRegularExpression without Unicode properties
+
 # Syntax highlighter for comments
 class CommentHighlighter(QSyntaxHighlighter):
+    # Match arguments looked up once. Block text comes from the document as a well-formed QString,
+    # so PCRE2's UTF-16 validity scan of every line can be skipped
+    _MATCH_TYPE = QRegularExpression.MatchType.NormalMatch
+    _MATCH_OPTIONS = QRegularExpression.MatchOption.DontCheckSubjectStringMatchOption
+
     def __init__(self, parent=None, target_language="cpp"):
         super().__init__(parent)
         self.comment_format = QTextCharFormat()
         self.comment_format.setForeground(QColor(Qt.GlobalColor.darkGreen))  # Green for comments
+        # Patterns are compiled once here, since highlightBlock runs for every line of the document;
+        # optimize() compiles them up front, JIT included where PCRE2 supports it
+        self._cpp_single = QRegularExpression(r"//.*$")
+        self._cpp_multi = QRegularExpression(r"/\*.*?\*/")
+        self._py_comment_loose = QRegularExpression(r"#.*$")  # Python output: any # starts a comment
+        for expr in (self._cpp_single, self._cpp_multi, self._py_comment_loose):
+            expr.optimize()
         self.target_language = target_language.lower()
+        self._active_rules = self._rules_for(self.target_language)
+        self._strict_hash = self.target_language != "python"
 
     def set_target_language(self, language):
-        self.target_language = language.lower()
+        language = language.lower()
+        if language == self.target_language:
+            return  # Called on every conversion; the document is highlighted for this language already
+        self.target_language = language
+        self._active_rules = self._rules_for(self.target_language)
+        self._strict_hash = self.target_language != "python"
         self.rehighlight()  # Reapply highlighting for new language
 
+    # Comment patterns applied for a target language
+    def _rules_for(self, language):
+        rules = [self._cpp_single]  # C++ single-line comments
+        if language == "cpp":
+            rules.append(self._cpp_multi)  # C++ multi-line comments
+        if language == "python":
+            rules.append(self._py_comment_loose)  # Python comments; other targets use _highlight_strict_hash
+        return tuple(rules)
+
     def highlightBlock(self, text):
-        # Highlight C++ single-line comments
-        cpp_single = QRegularExpression(r"//.*$")
-        match = cpp_single.match(text)
-        if match.hasMatch():
-            start = match.capturedStart()
-            length = match.capturedLength()
-            self.setFormat(start, length, self.comment_format)
-
-        # Highlight C++ multi-line comments if target is C++
-        if self.target_language == "cpp":
-            self._highlight_multiline(text, r"/\*.*?\*/", self.comment_format, True)
-
-        # Highlight Python comments, avoiding #include in C++
-        if self.target_language == "python":
-            python_comment = QRegularExpression(r"#.*$")
-        else:
-            python_comment = QRegularExpression(r"(?<!\s)#(?!(include))\s.*$")
-        match = python_comment.match(text)
-        if match.hasMatch():
-            start = match.capturedStart()
-            length = match.capturedLength()
-            self.setFormat(start, length, self.comment_format)
-
-    def _highlight_multiline(self, text, pattern, format, use_re=False):
-        # Helper to highlight multi-line patterns
-        if use_re:
-            expr = QRegularExpression(pattern)
-            match = expr.match(text)
-            while match.hasMatch():
-                start = match.capturedStart()
-                length = match.capturedLength()
-                self.setFormat(start, length, format)
-                match = expr.match(text, start + length)
-
-# Thread for running conversion without freezing UI
-class ConverterThread(QThread):
-    result = pyqtSignal(str)  # Signal for successful conversion
+        # Every comment form starts with / or #; most lines have neither, so skip them before any regex runs
+        if '/' not in text and '#' not in text:
+            return
+        # One globalMatch sweep per pattern finds every comment in the line
+        match_type, match_options = self._MATCH_TYPE, self._MATCH_OPTIONS
+        for expr in self._active_rules:
+            matches = expr.globalMatch(text, 0, match_type, match_options)
+            while matches.hasNext():
+                match = matches.next()
+                self.setFormat(match.capturedStart(), match.capturedLength(), self.comment_format)
+        if self._strict_hash:
+            self._highlight_strict_hash(text)
+
+    # "# comment" outside Python output: a # that doesn't follow whitespace and is followed by whitespace,
+    # up to the end of the line. Found with str.find instead of a lookbehind/lookahead regex; "#include"
+    # never qualifies, since its # is followed by a letter
+    def _highlight_strict_hash(self, text):
+        start = text.find("#")
+        while start != -1:
+            if (start == 0 or text[start - 1] not in _ASCII_WHITESPACE) and text[start + 1:start + 2] in _ASCII_WHITESPACE:
+                if not text.isascii():
+                    # setFormat counts UTF-16 code units, which differ from str indices past the BMP
+                    utf16_start = len(text[:start].encode("utf-16-le")) // 2
+                    self.setFormat(utf16_start, len(text.encode("utf-16-le")) // 2 - utf16_start, self.comment_format)
+                else:
+                    self.setFormat(start, len(text) - start, self.comment_format)
+                return
+            start = text.find("#", start + 1)
+
+# Worker process for conversions, started on first use and then reused. The parsers are pure Python,
+# so running them in another interpreter keeps the GIL free for the UI thread
+_pool = None
+
+def _conversion_pool():
+    global _pool
+    if _pool is None:
+        _pool = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+    return _pool
+
+def _discard_conversion_pool():
+    global _pool
+    _pool = None
+
+# Runs in the worker process; module-level so the pool can pickle it
+def _run_conversion(source_code, source_lang, target_lang, verbose):
+    if source_lang == 'c++':
+        return process_cpp_to_python(source_code, source_lang, target_lang, verbose=verbose)
+    return process_python_to_cpp(source_code, source_lang, target_lang, verbose=verbose)
+
+# Worker on a persistent thread that waits on the worker process without freezing UI.
+# Jobs arrive through a queued signal, so one OS thread serves every conversion
+class ConverterWorker(QObject):
+    # Converted code as a Python str. Typed object so the queued signal carries a reference instead of
+    # copying it to a QString and back; setPlainText does the one conversion Qt needs
+    result = pyqtSignal(object)
     error = pyqtSignal(str)   # Signal for errors
+    finished = pyqtSignal()   # Emitted after every job, whatever its outcome
 
-    def __init__(self, source_code, source_lang, target_lang):
+    def __init__(self, verbose=False):
         super().__init__()
-        self.source_code = source_code
-        self.source_lang = source_lang
-        self.target_lang = target_lang
+        self.verbose = verbose  # Console trace of tokens/AST from the worker process
 
-    def run(self):
+    # Runs on the worker thread; the pool is only ever touched from here, so its lazy start can't race
+    @pyqtSlot(str, str, str)
+    def convert(self, source_code, source_lang, target_lang):
         try:
-            # Write source code to temp file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.txt') as temp_file:
-                temp_file.write(self.source_code.encode('utf-8'))
-                temp_path = temp_file.name
-            
-            # Select conversion function based on languages
-            if self.source_lang == 'c++' and self.target_lang == 'python':
-                output = process_cpp_to_python(temp_path, self.source_lang, self.target_lang, verbose=True)
-            elif self.source_lang == 'python' and self.target_lang == 'c++':
-                output = process_python_to_cpp(temp_path, self.source_lang, self.target_lang, verbose=True)
-            else:
-                self.error.emit(f"Unsupported conversion from {self.source_lang} to {self.target_lang}")
+            self._convert(source_code, source_lang, target_lang)
+        finally:
+            self.finished.emit()
+
+    def _convert(self, source_code, source_lang, target_lang):
+        try:
+            # Check the language pair here; the source is passed to the worker in memory, not via a temp file
+            if (source_lang, target_lang) not in (('c++', 'python'), ('python', 'c++')):
+                self.error.emit(f"Unsupported conversion from {source_lang} to {target_lang}")
                 return
+            future = _conversion_pool().submit(_run_conversion, source_code, source_lang, target_lang, self.verbose)
+            output = future.result()  # Blocks this thread only, with the GIL released
             
             # Process output (string or file path)
             if isinstance(output, str):
                 converted_code = output
             else:
-                if output is None or not os.path.exists(output):
+                # Opening the file is the existence check, so there's no separate stat to race against
+                try:
+                    if output is None:
+                        raise FileNotFoundError
+                    with open(output, "r", encoding='utf-8') as file:
+                        converted_code = file.read()
+                except FileNotFoundError:
                     self.error.emit("Conversion failed. No output file was generated or file does not exist.")
                     return
-                with open(output, "r", encoding='utf-8') as file:
-                    converted_code = file.read()
-                if os.path.exists(output):
-                    os.remove(output)  # Clean up temp output file
+                try:
+                    os.unlink(output)  # Clean up temp output file
+                except OSError:
+                    pass
 
             if not converted_code.strip():
                 self.error.emit("Converted code is empty or contains only whitespace!")
                 return
             
             self.result.emit(converted_code)
+        except concurrent.futures.BrokenExecutor as e:
+            _discard_conversion_pool()  # The worker died; the next conversion starts a fresh one
+            logging.error(f"Conversion error: {str(e)}")
+            self.error.emit(f"An unexpected error occurred: {str(e)}")
         except Exception as e:
             logging.error(f"Conversion error: {str(e)}")
             self.error.emit(f"An unexpected error occurred: {str(e)}")
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)  # Clean up temp input file
+
+# Title bar that drags its window. Mouse events are handled here, so only presses and moves over the
+# bar reach Python rather than every event the main window receives
+class DragBar(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.drag_position = None  # Cursor offset from the window's top-left while dragging
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.drag_position = event.globalPosition().toPoint() - self.window().frameGeometry().topLeft()
+            event.accept()
+        else:
+            super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self.drag_position is not None and event.buttons() == Qt.MouseButton.LeftButton:
+            self.window().move(event.globalPosition().toPoint() - self.drag_position)
+            event.accept()
+        else:
+            super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.drag_position = None
+            event.accept()
+        else:
+            super().mouseReleaseEvent(event)
 
 # Main application window
 class CodeConverterWindow(QMainWindow):
+    conversion_requested = pyqtSignal(str, str, str)  # Queued to the worker thread
+
     def __init__(self):
         super().__init__()
-        self.dragging = False  # For window dragging
-        self.drag_position = None
         self.title_bar = None  
         self.init_ui()  # Set up UI
+        self.init_worker()
+
+    # One worker thread for the window's lifetime instead of a new QThread per click
+    def init_worker(self):
+        self.worker = ConverterWorker()
+        self.worker_thread = QThread(self)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker_thread.finished.connect(self.worker.deleteLater)
+        self.conversion_requested.connect(self.worker.convert)
+        self.worker.result.connect(self.on_conversion_finished)
+        self.worker.error.connect(self.on_conversion_error)
+        self.worker.finished.connect(self.on_thread_finished)
+        self.worker_thread.start()
+
+    # Let a running job finish and stop the worker thread before the window goes away
+    def closeEvent(self, event):
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        super().closeEvent(event)
 
     def init_ui(self):
         # Basic window setup
         self.setWindowTitle("KENGEN: BASIC PROGRAMMMING LANGUAGE CONVERTER AND SYNTAX ANALYZER")
         self.setGeometry(100, 100, 1200, 900)
-        icon_path = os.path.join(os.path.dirname(__file__), "logo.png")
+        icon_path = _asset("logo.png")
         self.setWindowIcon(QIcon(icon_path))
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowMinimizeButtonHint | 
                             Qt.WindowType.WindowMaximizeButtonHint | Qt.WindowType.WindowCloseButtonHint)
@@ -149,16 +280,15 @@ class CodeConverterWindow(QMainWindow):
         """)
 
         # Custom title bar with logo and buttons
-        self.title_bar = QWidget()
+        self.title_bar = DragBar()
         title_bar_layout = QHBoxLayout(self.title_bar)
         title_bar_layout.setContentsMargins(0, 0, 0, 0)
         title_bar_layout.setSpacing(0)
 
         logo_label = QLabel(self.title_bar)
-        logo_path = os.path.join(os.path.dirname(__file__), "logo.png")
+        logo_path = _asset("logo.png")
         try:
-            logo_pixmap = QPixmap(logo_path).scaled(24, 24, Qt.AspectRatioMode.KeepAspectRatio, 
-                                                    Qt.TransformationMode.SmoothTransformation)
+            logo_pixmap = _icon(logo_path, 24, 24)
             if logo_pixmap.isNull():
                 raise ValueError(f"Failed to load image: {logo_path}")
             logo_label.setPixmap(logo_pixmap)
@@ -178,9 +308,8 @@ class CodeConverterWindow(QMainWindow):
 
         # Minimize button
         minimize_button = QLabel(self.title_bar)
-        minimize_icon_path = os.path.join(os.path.dirname(__file__), "minimize.png")
-        minimize_pixmap = QPixmap(minimize_icon_path).scaled(30, 30, Qt.AspectRatioMode.KeepAspectRatio, 
-                                                             Qt.TransformationMode.SmoothTransformation)
+        minimize_icon_path = _asset("minimize.png")
+        minimize_pixmap = _icon(minimize_icon_path, 30, 30)
         minimize_button.setPixmap(minimize_pixmap)
         minimize_button.setFixedSize(30, 30)
         minimize_button.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -193,9 +322,8 @@ class CodeConverterWindow(QMainWindow):
 
         # Maximize/Restore button
         self.maximize_button = QLabel(self.title_bar)
-        self.maximize_icon_path = os.path.join(os.path.dirname(__file__), "zoom.png")
-        self.maximize_pixmap = QPixmap(self.maximize_icon_path).scaled(30, 30, Qt.AspectRatioMode.KeepAspectRatio, 
-                                                                       Qt.TransformationMode.SmoothTransformation)
+        self.maximize_icon_path = _asset("zoom.png")
+        self.maximize_pixmap = _icon(self.maximize_icon_path, 30, 30)
         self.maximize_button.setPixmap(self.maximize_pixmap)
         self.maximize_button.setFixedSize(30, 30)
         self.maximize_button.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -208,9 +336,8 @@ class CodeConverterWindow(QMainWindow):
 
         # Close button
         close_button = QLabel(self.title_bar)
-        close_icon_path = os.path.join(os.path.dirname(__file__), "close.png")
-        close_pixmap = QPixmap(close_icon_path).scaled(20, 20, Qt.AspectRatioMode.KeepAspectRatio, 
-                                                       Qt.TransformationMode.SmoothTransformation)
+        close_icon_path = _asset("close.png")
+        close_pixmap = _icon(close_icon_path, 20, 20)
         close_button.setPixmap(close_pixmap)
         close_button.setFixedSize(30, 30)
         close_button.setCursor(Qt.CursorShape.PointingHandCursor)
@@ -232,21 +359,16 @@ class CodeConverterWindow(QMainWindow):
 
         # Logo overlay in background
         self.logo_overlay = QLabel(self)
-        logo_path = os.path.join(os.path.dirname(__file__), "logo.png")
+        logo_path = _asset("logo.png")
         try:
-            logo_pixmap = QPixmap(logo_path)
-            if logo_pixmap.isNull():
-                raise ValueError(f"Failed to load image: {logo_path}")
             max_width, max_height = 500, 500
-            scaled_pixmap = logo_pixmap.scaled(max_width, max_height, Qt.AspectRatioMode.KeepAspectRatio, 
-                                               Qt.TransformationMode.SmoothTransformation)
-            self.logo_overlay.setPixmap(scaled_pixmap)
+            scaled_pixmap = _icon(logo_path, max_width, max_height)
+            if scaled_pixmap.isNull():
+                raise ValueError(f"Failed to load image: {logo_path}")
+            self.logo_overlay.setPixmap(_faded(scaled_pixmap, 0.1))  # 10% opacity, baked into the pixels
             self.logo_overlay.setFixedSize(scaled_pixmap.size())
             self.logo_overlay.setStyleSheet("background: transparent;")
             self.logo_overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
-            opacity_effect = QGraphicsOpacityEffect(self.logo_overlay)
-            opacity_effect.setOpacity(0.1)
-            self.logo_overlay.setGraphicsEffect(opacity_effect)
             self.position_logo_in_center()
             self.logo_overlay.raise_()
         except Exception as e:
@@ -275,18 +397,9 @@ class CodeConverterWindow(QMainWindow):
         self.target_lang_combo.setFont(text_font)
         main_layout.addWidget(self.target_lang_combo)
 
-        # Auto-update target language based on source
-        def update_target_language(index):
-            source_lang = self.source_lang_combo.currentText()
-            if source_lang == "Python":
-                self.target_lang_combo.setCurrentText("C++")
-            elif source_lang == "C++":
-                self.target_lang_combo.setCurrentText("Python")
-        
-        self.source_lang_combo.currentIndexChanged.connect(update_target_language)
-        update_target_language(self.source_lang_combo.currentIndex())
-
-        self.source_lang_combo.currentIndexChanged.connect(self.clear_text_edits)
+        # Auto-update target language based on source; one handler per combo
+        self.sync_target_language()
+        self.source_lang_combo.currentIndexChanged.connect(self.on_source_language_changed)
         self.target_lang_combo.currentIndexChanged.connect(self.clear_text_edits)
 
         # Code input/output layout
@@ -324,16 +437,20 @@ class CodeConverterWindow(QMainWindow):
         target_layout_inner.addWidget(self.target_code_text)
 
         # Copy icon for converted code
-        copy_icon_path = os.path.join(os.path.dirname(__file__), "copy-icon.png")
+        copy_icon_path = _asset("copy-icon.png")
         self.copy_icon = QLabel(self.target_code_container)
-        pixmap = QPixmap(copy_icon_path).scaled(20, 20, Qt.AspectRatioMode.KeepAspectRatio, 
-                                                Qt.TransformationMode.SmoothTransformation)
+        pixmap = _icon(copy_icon_path, 20, 20)
         self.copy_icon.setPixmap(pixmap)
         self.copy_icon.setFixedSize(24, 24)
         self.copy_icon.setCursor(Qt.CursorShape.PointingHandCursor)
         self.copy_icon.mousePressEvent = self.copy_converted_code_event
         self.copy_icon.raise_()
 
+        # Resize events arrive in bursts while the window is dragged; reposition the icon once per frame
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._apply_copy_icon_position)
         self.target_code_container.resizeEvent = self.resize_copy_icon
         output_layout.addWidget(self.target_code_container)
         code_layout.addLayout(output_layout)
@@ -359,7 +476,7 @@ class CodeConverterWindow(QMainWindow):
         code_layout.setStretch(0, 1)
         code_layout.setStretch(2, 1)
 
-        self.resize_copy_icon(None)
+        self._apply_copy_icon_position()
         self.position_logo_in_center()
 
         self.comments_highlighter = CommentHighlighter(self.target_code_text.document())
@@ -380,43 +497,25 @@ class CodeConverterWindow(QMainWindow):
             self.close()
         event.accept()
 
-    # Window dragging
-    def mousePressEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton and self.title_bar and self.title_bar.geometry().contains(event.position().toPoint()):
-            self.dragging = True
-            self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
-            event.accept()
-
-    def mouseMoveEvent(self, event):
-        if self.dragging and event.buttons() == Qt.MouseButton.LeftButton and self.drag_position is not None:
-            self.move(event.globalPosition().toPoint() - self.drag_position)
-            event.accept()
-
-    def mouseReleaseEvent(self, event):
-        if event.button() == Qt.MouseButton.LeftButton:
-            self.dragging = False
-            self.drag_position = None
-            event.accept()
-
     def toggle_maximize(self):
         if self.isMaximized():
             self.showNormal()
-            self.maximize_button.setPixmap(QPixmap(self.maximize_icon_path).scaled(30, 30, Qt.AspectRatioMode.KeepAspectRatio, 
-                                                                                   Qt.TransformationMode.SmoothTransformation))
         else:
             self.showMaximized()
-            self.maximize_button.setPixmap(QPixmap(self.maximize_icon_path).scaled(30, 30, Qt.AspectRatioMode.KeepAspectRatio, 
-                                                                                   Qt.TransformationMode.SmoothTransformation))
+        self.maximize_button.setPixmap(self.maximize_pixmap)  # Same icon either way, scaled once in init_ui
 
     # Positioning helpers
     def resize_copy_icon(self, event):
+        self._resize_timer.start()  # Restarting coalesces a burst into one _apply_copy_icon_position
+        if event:
+            event.accept()
+
+    def _apply_copy_icon_position(self):
+        # Moving the icon repaints the area it uncovers, so the text viewport needs no explicit update
         container_width = self.target_code_container.width()
         icon_width = self.copy_icon.width()
         self.copy_icon.move(container_width - icon_width - 10, 10)
         self.copy_icon.raise_()
-        self.target_code_text.viewport().update()
-        if event:
-            event.accept()
 
     def position_logo_in_center(self):
         if hasattr(self, 'logo_overlay'):
@@ -433,7 +532,9 @@ class CodeConverterWindow(QMainWindow):
 
     # Core functionality
     def convert_code(self):
-        source_code = self.source_code_text.toPlainText().strip()
+        # An empty document is rejected without copying its text out; whitespace-only text still needs the strip
+        source_document = self.source_code_text.document()
+        source_code = "" if source_document.isEmpty() else source_document.toPlainText().strip()
         source_language = self.source_lang_combo.currentText().lower()
         target_language = self.target_lang_combo.currentText().lower()
 
@@ -449,16 +550,18 @@ class CodeConverterWindow(QMainWindow):
         self.convert_button.setEnabled(False)
         self.clear_button.setEnabled(False)
 
-        self.thread = ConverterThread(source_code, source_language, target_language)
-        self.thread.result.connect(self.on_conversion_finished)
-        self.thread.error.connect(self.on_conversion_error)
-        self.thread.finished.connect(self.on_thread_finished)
-        self.thread.start()
+        self.conversion_requested.emit(source_code, source_language, target_language)
 
     def on_conversion_finished(self, result):
-        self.target_code_text.setText(result)
-        self.comments_highlighter.rehighlight()
-        self.target_code_text.viewport().update()
+        # Plain text, so "#include <iostream>" isn't sniffed as HTML. The highlighter already runs on the new
+        # contents, and layout is repainted once when updates come back on
+        target = self.target_code_text
+        target.setUpdatesEnabled(False)
+        target.setUndoRedoEnabled(False)  # setPlainText clears the history anyway; don't record the insert
+        target.setPlainText(result)
+        target.setUndoRedoEnabled(True)
+        target.setUpdatesEnabled(True)
+        target.viewport().update()
 
     def on_conversion_error(self, error):
         QMessageBox.critical(self, "Error", error)
@@ -473,7 +576,8 @@ class CodeConverterWindow(QMainWindow):
 
     def copy_converted_code_event(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            converted_code = self.target_code_text.toPlainText().strip()
+            target_document = self.target_code_text.document()
+            converted_code = "" if target_document.isEmpty() else target_document.toPlainText().strip()
             if converted_code:
                 clipboard = QApplication.clipboard()
                 clipboard.setText(converted_code)
@@ -482,6 +586,21 @@ class CodeConverterWindow(QMainWindow):
                 QMessageBox.warning(self, "Warning", "No converted code available to copy!")
         event.accept()
 
+    # Source change: switch the target to the other language, then clear the editors once
+    def on_source_language_changed(self, index):
+        self.sync_target_language()
+        self.clear_text_edits()
+
+    # Signals are blocked so the target combo doesn't run its own clear as well
+    def sync_target_language(self):
+        source_lang = self.source_lang_combo.currentText()
+        blocked = self.target_lang_combo.blockSignals(True)
+        if source_lang == "Python":
+            self.target_lang_combo.setCurrentText("C++")
+        elif source_lang == "C++":
+            self.target_lang_combo.setCurrentText("Python")
+        self.target_lang_combo.blockSignals(blocked)
+
     def clear_text_edits(self):
         self.source_code_text.clear()
         self.target_code_text.clear()